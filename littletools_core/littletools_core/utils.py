@@ -57,12 +57,15 @@ import os
 import platform
 import shutil
 import signal
+import stat
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Union
@@ -81,12 +84,57 @@ console = Console()  # Add console for run_tasks_with_semaphore
 
 # * Global variables for signal handling
 _interrupted = False
-_cleanup_functions: List[Callable[[], None]] = []
+# * Immutable tuple, rebound on registration so the signal handler always
+# * iterates a consistent snapshot
+_cleanup_functions: tuple[Callable[[], None], ...] = ()
 
 # * Default directories used across all tools
 DEFAULT_INPUT_DIR_NAME = "0-INPUT-0"
 DEFAULT_OUTPUT_DIR_NAME = "0-OUTPUT-0"
 
+# * Working directory cache for get_default_io_paths (re-read after a fork)
+_CWD_CACHE: Optional[str] = None
+_CWD_PID: Optional[int] = None
+_IO_PATHS_CACHE: Dict[str, tuple[Path, Path]] = {}
+
+# * Platform details never change during a run, so query them once at import
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_CLEAR_CMD = "cls" if _IS_WINDOWS else "clear"
+_PLATFORM_INFO: Dict[str, Any] = {
+    "system": _SYSTEM,
+    "is_windows": _IS_WINDOWS,
+    "is_linux": _SYSTEM == "Linux",
+    "is_macos": _SYSTEM == "Darwin",
+    "architecture": platform.architecture()[0],
+    "python_version": platform.python_version(),
+}
+
+
+def _enable_ansi_support() -> bool:
+    """Return True if the console understands ANSI escape sequences."""
+    if not _IS_WINDOWS:
+        return True
+    if os.environ.get("WT_SESSION"):
+        # * Windows Terminal always supports VT sequences
+        return True
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.GetStdHandle(-11)  # * STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # * ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:  # noqa: BLE001
+        return False
+
+
+_ANSI_ENABLED = _enable_ansi_support()
+_ANSI_CLEAR = "\x1b[2J\x1b[H"
+
 
 def is_interrupted() -> bool:
     """Check if the program has been interrupted by a signal."""
@@ -95,39 +143,63 @@ def is_interrupted() -> bool:
 
 def register_cleanup_function(func: Callable[[], None]) -> None:
     """Register a cleanup function to be called when the program is interrupted."""
-    global _cleanup_functions  # noqa: F824
-    _cleanup_functions.append(func)
+    global _cleanup_functions
+    _cleanup_functions = _cleanup_functions + (func,)
 
 
 def _signal_handler(signum: int, frame: Any) -> None:  # noqa: D401
     """Handle interrupt signals gracefully (e.g., Ctrl+C)."""
     global _interrupted
+    # * Reentry guard: a second Ctrl+C must not run the cleanup twice
+    if _interrupted:
+        return
     _interrupted = True
+    # * Ignore further SIGINTs while cleaning up
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-    print("\n\n! Operation interrupted by user. Cleaning up...")
-
-    # * Execute all registered cleanup functions
-    for cleanup_func in _cleanup_functions:
-        try:
-            cleanup_func()
-        except Exception as e:  # noqa: BLE001
-            print(f"! Warning: Cleanup function failed: {e}")
+    # ! Write to stderr directly: print() may block on the stdout lock if the
+    #   signal arrived in the middle of another print call.
+    try:
+        sys.stderr.write("\n\n! Operation interrupted by user. Cleaning up...\n")
 
-    sys.exit(0)
+        # * Execute all registered cleanup functions from a snapshot
+        snapshot = _cleanup_functions
+        for cleanup_func in snapshot:
+            try:
+                cleanup_func()
+            except Exception as e:  # noqa: BLE001
+                sys.stderr.write(f"! Warning: Cleanup function failed: {e}\n")
+    finally:
+        sys.exit(0)
 
 
 def setup_signal_handler() -> None:
     """Set up signal handler for graceful interruption."""
     signal.signal(signal.SIGINT, _signal_handler)
+    # * Restart interrupted system calls instead of failing them with EINTR
+    try:
+        signal.siginterrupt(signal.SIGINT, False)
+    except (AttributeError, OSError):
+        pass  # * Not available on Windows
+
+
+# * NOTE: The single-shot helpers below work on os.fspath() strings and plain
+#   os/os.path calls; building a Path just to turn it back into a str is
+#   pure overhead for them.
+
+
+def _safe_delete_raw(file_path: str) -> None:
+    """Send *file_path* to the recycle bin, letting errors propagate."""
+    send2trash.send2trash(file_path)
 
 
 def safe_delete(file_path: Union[str, Path]) -> bool:
     """Safely delete a file by sending it to the recycle bin/trash."""
     try:
-        file_path = Path(file_path)
-        if file_path.exists():
-            send2trash.send2trash(str(file_path))
-            print(f"* File moved to recycle bin: {file_path.name}")
+        file_path = os.fspath(file_path)
+        if os.path.lexists(file_path):
+            _safe_delete_raw(file_path)
+            print(f"* File moved to recycle bin: {os.path.basename(file_path)}")
             return True
         print(f"! Warning: File not found: {file_path}")
         return False
@@ -136,11 +208,42 @@ def safe_delete(file_path: Union[str, Path]) -> bool:
         return False
 
 
+def safe_delete_many(file_paths: Iterable[Union[str, Path]]) -> int:
+    """Send several files to the recycle bin/trash in one batch.
+
+    Returns the number of files that were moved. If the batched call fails,
+    each file is retried individually to maximise partial success.
+    """
+    existing = [
+        path
+        for path in (os.fspath(file_path) for file_path in file_paths)
+        if os.path.lexists(path)
+    ]
+    if not existing:
+        return 0
+
+    try:
+        # * The list form is handled by a single shell operation
+        send2trash.send2trash(existing)
+    except Exception as e:  # noqa: BLE001
+        print(f"! Batch deletion failed ({e}), retrying file by file...")
+        moved = 0
+        for path in existing:
+            try:
+                send2trash.send2trash(path)
+                moved += 1
+            except Exception as item_error:  # noqa: BLE001
+                print(f"! Error deleting file {path}: {item_error}")
+        return moved
+
+    print(f"* {len(existing)} file(s) moved to recycle bin")
+    return len(existing)
+
+
 def ensure_dir_exists(dir_path: Union[str, Path]) -> bool:
     """Create directory if it doesn't exist."""
     try:
-        dir_path = Path(dir_path)
-        dir_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.fspath(dir_path), exist_ok=True)
         return True
     except Exception as e:  # noqa: BLE001
         print(f"! Error creating directory {dir_path}: {e}")
@@ -152,18 +255,22 @@ def get_files_by_extension(
 ) -> List[Path]:
     """Return all files with specified extensions from a directory."""
     try:
-        directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
+        if not os.path.isdir(directory):
             return []
 
-        files: List[Path] = []
-        for ext in extensions:
-            if not ext.startswith("."):
-                ext = "." + ext
-            files.extend(directory.glob(f"*{ext.lower()}"))
-            files.extend(directory.glob(f"*{ext.upper()}"))
+        # * str.endswith accepts a tuple, so all extensions are tested at once
+        suffixes = tuple("." + ext.lstrip(".").lower() for ext in extensions)
+
+        # * One scandir pass matches case-insensitively without a second glob
+        with os.scandir(directory) as entries:
+            files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith(suffixes) and entry.is_file()
+            ]
 
-        return sorted(list(set(files)))  # Remove duplicates and sort
+        files.sort()
+        return files
     except Exception as e:  # noqa: BLE001
         print(f"! Error scanning directory {directory}: {e}")
         return []
@@ -173,29 +280,37 @@ def check_file_exists_with_overwrite(
     output_path: Union[str, Path], overwrite: bool = False
 ) -> bool:
     """Check if output file exists and handle based on overwrite flag."""
-    output_path = Path(output_path)
-    if output_path.exists():
+    output_path = os.fspath(output_path)
+    if os.path.exists(output_path):
+        name = os.path.basename(output_path)
         if overwrite:
-            print(f"* File exists, will overwrite: {output_path.name}")
+            print(f"* File exists, will overwrite: {name}")
             return False
-        print(f"* File exists, skipping: {output_path.name}")
+        print(f"* File exists, skipping: {name}")
         return True
     return False
 
 
 def clean_partial_output(output_path: Union[str, Path], max_attempts: int = 3) -> bool:
     """Delete a partially processed output file using safe deletion."""
-    output_path = Path(output_path)
-    if not output_path.exists():
+    output_path = os.fspath(output_path)
+    if not os.path.exists(output_path):
         return False
 
+    delay = 0.1
     for attempt in range(max_attempts):
         try:
-            if safe_delete(output_path):
-                return True
+            _safe_delete_raw(output_path)
+            print(f"* File moved to recycle bin: {os.path.basename(output_path)}")
+            return True
         except Exception as e:  # noqa: BLE001
+            # * Nothing left to retry if the file disappeared in the meantime
+            if not os.path.exists(output_path):
+                return False
             if attempt < max_attempts - 1:
-                time.sleep(1)
+                # * Exponential backoff while the file is still locked
+                time.sleep(delay)
+                delay *= 2
             else:
                 print(
                     f"! Failed to delete partial file after {max_attempts} attempts: {e}"
@@ -205,69 +320,84 @@ def clean_partial_output(output_path: Union[str, Path], max_attempts: int = 3) -
 
 def print_separator(char: str = "═", length: int = 50) -> None:
     """Print a separator line for better console readability."""
-    print("\n" + char * length + "\n")
+    sys.stdout.write(f"\n{char * length}\n\n")
 
 
 def print_file_info(
     filename: str, current: int, total: int, extra_info: str = ""
 ) -> None:
     """Print information about the file being processed."""
-    extra = f" ({extra_info})" if extra_info else ""
-    print(f"[{current}/{total}] {filename}{extra}")
+    if extra_info:
+        sys.stdout.write(f"[{current}/{total}] {filename} ({extra_info})\n")
+    else:
+        sys.stdout.write(f"[{current}/{total}] {filename}\n")
+
+
+# * Status prefixes include the trailing space to avoid an extra format step
+_STATUS_PREFIXES = {
+    "info": "* ",
+    "success": "✓ ",
+    "warning": "! ",
+    "error": "! ",
+}
+_DEFAULT_STATUS_PREFIX = "* "
 
 
 def print_status(message: str, status_type: str = "info") -> None:
     """Print a status message with appropriate formatting."""
-    prefixes = {
-        "info": "*",
-        "success": "✓",
-        "warning": "!",
-        "error": "!",
-    }
-    prefix = prefixes.get(status_type, "*")
-    print(f"{prefix} {message}")
+    prefix = _STATUS_PREFIXES.get(status_type, _DEFAULT_STATUS_PREFIX)
+    sys.stdout.write(prefix + message + "\n")
 
 
 def clear_screen_if_compact(is_compact: bool) -> None:
     """Clear the terminal screen if compact mode is enabled."""
     if is_compact:
-        os.system("cls" if platform.system() == "Windows" else "clear")
+        if _ANSI_ENABLED:
+            # * A direct escape write avoids spawning a shell per redraw
+            sys.stdout.write(_ANSI_CLEAR)
+            sys.stdout.flush()
+        else:
+            os.system(_CLEAR_CMD)  # * Legacy Windows console fallback
 
 
 def format_duration(seconds: float) -> str:
     """Format seconds to HH:MM:SS or MM:SS."""
-    if seconds >= 3600:
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+    # * Negative, NaN and infinite inputs would raise or render nonsense
+    if not 0 < seconds < float("inf"):
+        return "00:00"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
     return f"{minutes:02d}:{secs:02d}"
 
 
 def get_platform_info() -> Dict[str, Any]:
     """Return information about the current platform."""
-    system = platform.system()
-    return {
-        "system": system,
-        "is_windows": system == "Windows",
-        "is_linux": system == "Linux",
-        "is_macos": system == "Darwin",
-        "architecture": platform.architecture()[0],
-        "python_version": platform.python_version(),
-    }
+    # * Return a copy so callers cannot mutate the cached snapshot
+    return dict(_PLATFORM_INFO)
+
+
+@lru_cache(maxsize=128)
+def _which_cached(command: str) -> Optional[str]:
+    """Resolve *command* in PATH once per process."""
+    return shutil.which(command)
 
 
 def check_command_available(command: str) -> bool:
     """Return True if a command is available in PATH."""
-    return shutil.which(command) is not None
+    return _which_cached(command) is not None
+
+
+# * Allow callers (e.g. after editing PATH) to drop cached lookups
+check_command_available.cache_clear = _which_cached.cache_clear  # type: ignore[attr-defined]
 
 
 def create_backup_name(file_path: Union[str, Path], suffix: str = "_backup") -> Path:
     """Create a backup filename by adding a suffix before the extension."""
-    file_path = Path(file_path)
-    return file_path.parent / f"{file_path.stem}{suffix}{file_path.suffix}"
+    # * One splitext instead of Path.parent/.stem/.suffix plus a join
+    root, ext = os.path.splitext(os.fspath(file_path))
+    return Path(f"{root}{suffix}{ext}")
 
 
 def prompt_for_path(
@@ -301,19 +431,25 @@ def prompt_for_path(
 
         resolved_path = Path(cleaned_path_str).resolve()
 
-        if must_exist and not resolved_path.exists():
+        # * A single stat answers the exists/is_file/is_dir questions at once
+        try:
+            mode: Optional[int] = os.stat(resolved_path).st_mode
+        except (OSError, ValueError):
+            mode = None
+
+        if must_exist and mode is None:
             console.print(
                 f"[red]! Path not found: '{resolved_path}'[/red]. Please try again."
             )
             continue
 
-        if not file_okay and resolved_path.is_file():
+        if not file_okay and mode is not None and stat.S_ISREG(mode):
             console.print(
                 f"[red]! Path must be a directory, not a file: '{resolved_path}'[/red]."
             )
             continue
 
-        if not dir_okay and resolved_path.is_dir():
+        if not dir_okay and mode is not None and stat.S_ISDIR(mode):
             console.print(
                 f"[red]! Path must be a file, not a directory: '{resolved_path}'[/red]."
             )
@@ -323,17 +459,43 @@ def prompt_for_path(
 
 
 class BatchTimeEstimator:
-    """Estimate remaining time for a batch process based on workload."""
+    """Estimate remaining time for a batch process based on workload.
+
+    The cumulative processing rate (all workload done over the time since
+    :meth:`start`) is smoothed with an exponentially weighted moving average
+    that is refreshed in :meth:`update`, so :meth:`get_eta_str` is plain
+    arithmetic and smooths out noisy early measurements. Cumulative samples
+    stay sane when concurrent items finish almost at the same moment.
+    """
+
+    __slots__ = (
+        "_start_ns",
+        "_rate_ema",
+        "total_workload",
+        "workload_processed",
+        "items_processed",
+    )
+
+    # * Weight given to the newest rate sample
+    RATE_SMOOTHING = 0.3
 
     def __init__(self) -> None:
-        self.start_time: Optional[float] = None
+        # * Timestamps are integer nanoseconds from the monotonic clock
+        self._start_ns: Optional[int] = None
+        # * Workload units per nanosecond
+        self._rate_ema: float = 0.0
         self.total_workload: float = 0.0
         self.workload_processed: float = 0.0
         self.items_processed: int = 0
 
+    @property
+    def start_time(self) -> Optional[float]:
+        """Monotonic start time in seconds, or None if not started."""
+        return None if self._start_ns is None else self._start_ns / 1e9
+
     def start(self) -> None:
         """Start the master timer for the batch process."""
-        self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
 
     def add_item(self, workload: float) -> None:
         """Add an item's workload to the total."""
@@ -344,29 +506,34 @@ class BatchTimeEstimator:
         """Update the estimator with the workload just completed."""
         if workload_done > 0:
             self.workload_processed += workload_done
+            if self._start_ns is not None:
+                elapsed = time.monotonic_ns() - self._start_ns
+                if elapsed > 0:
+                    sample_rate = self.workload_processed / elapsed
+                    if self._rate_ema > 0:
+                        self._rate_ema += self.RATE_SMOOTHING * (
+                            sample_rate - self._rate_ema
+                        )
+                    else:
+                        self._rate_ema = sample_rate
         self.items_processed += 1
 
     def get_eta_str(self) -> str:
         """Return formatted ETA or 'N/A' if not enough info."""
+        processing_rate = self._rate_ema
         if (
-            self.start_time is None
-            or self.items_processed == 0
+            self.items_processed == 0
             or self.workload_processed <= 0
+            or processing_rate <= 0
         ):
             return "N/A"
 
-        elapsed_time = time.time() - self.start_time
-        if elapsed_time <= 0:
-            return "N/A"
-        processing_rate = self.workload_processed / elapsed_time
-        if processing_rate <= 0:
-            return "N/A"
-
         remaining_workload = self.total_workload - self.workload_processed
         # * If no remaining workload, return zero ETA to avoid negative values
         if remaining_workload <= 0:
             return format_duration(0)
-        estimated_seconds = remaining_workload / processing_rate
+        # * Convert nanoseconds to seconds only for the final formatting
+        estimated_seconds = remaining_workload / processing_rate / 1e9
         return format_duration(estimated_seconds)
 
 
@@ -378,13 +545,48 @@ def get_default_io_paths(tool_slug: str = "") -> tuple[Path, Path]:
 
     Returns:
         (input_dir, output_dir)
+
+    Note:
+        The working directory is read once per process and the resulting
+        paths are cached per ``tool_slug``.
+    """
+    global _CWD_CACHE, _CWD_PID
+    pid = os.getpid()
+    if _CWD_CACHE is None or _CWD_PID != pid:
+        _CWD_CACHE = os.getcwd()
+        _CWD_PID = pid
+        _IO_PATHS_CACHE.clear()
+
+    cached = _IO_PATHS_CACHE.get(tool_slug)
+    if cached is None:
+        input_dir = Path(os.path.join(_CWD_CACHE, DEFAULT_INPUT_DIR_NAME))
+        if tool_slug:
+            output_dir = Path(
+                os.path.join(_CWD_CACHE, DEFAULT_OUTPUT_DIR_NAME, tool_slug)
+            )
+        else:
+            output_dir = Path(os.path.join(_CWD_CACHE, DEFAULT_OUTPUT_DIR_NAME))
+        cached = (input_dir, output_dir)
+        _IO_PATHS_CACHE[tool_slug] = cached
+    return cached
+
+
+def _build_settings_menu_rows(
+    settings_definitions: List[Dict[str, Any]],
+) -> List[tuple[Dict[str, Any], str, Dict[Any, str]]]:
+    """Return (definition, row prefix, value -> display name) for each setting.
+
+    The menu layout is fixed for the whole session, so the rows are built once
+    instead of on every redraw.
     """
-    cwd = Path.cwd()
-    input_dir = cwd / DEFAULT_INPUT_DIR_NAME
-    output_dir = cwd / DEFAULT_OUTPUT_DIR_NAME
-    if tool_slug:
-        output_dir = output_dir / tool_slug
-    return input_dir, output_dir
+    rows: List[tuple[Dict[str, Any], str, Dict[Any, str]]] = []
+    for i, definition in enumerate(settings_definitions, 1):
+        reverse_map: Dict[Any, str] = {}
+        for name, value in definition.get("choices", {}).items():
+            reverse_map.setdefault(value, name)  # * First matching name wins
+        row_prefix = f" [cyan]{i}.[/cyan] {definition['label']:<15} : "
+        rows.append((definition, row_prefix, reverse_map))
+    return rows
 
 
 def prompt_for_interactive_settings(
@@ -456,23 +658,22 @@ def prompt_for_interactive_settings(
                 f"[red]Invalid choice. Please enter a number from 1 to {len(choices)}.[/red]"
             )
 
+    rows = _build_settings_menu_rows(settings_definitions)
+
+    cprint = console.print
+    prompt = typer.prompt
+
     while True:
         console.clear()
-        console.print(f"[bold underline]{title}[/bold underline]")
+        cprint(f"[bold underline]{title}[/bold underline]")
 
-        for i, definition in enumerate(settings_definitions, 1):
-            key = definition["key"]
-            label = definition["label"]
+        for definition, row_prefix, reverse_map in rows:
             setting_type = definition["type"]
-            current_value = current_settings[key]
+            current_value = current_settings[definition["key"]]
 
             display_value = ""
             if setting_type == "choice":
-                choices = definition["choices"]
-                display_value = next(
-                    (name for name, value in choices.items() if value == current_value),
-                    "N/A",
-                )
+                display_value = reverse_map.get(current_value, "N/A")
             elif setting_type == "toggle":
                 display_map = definition.get("display_map")
                 if display_map and current_value in display_map:
@@ -482,12 +683,12 @@ def prompt_for_interactive_settings(
                 else:
                     display_value = "On" if current_value else "Off"
 
-            console.print(f" [cyan]{i}.[/cyan] {label:<15} : {display_value}")
+            cprint(row_prefix + display_value)
 
-        console.print("\n [bold green]S[/bold green]. Start")
-        console.print(" [bold red]Q[/bold red]. Quit")
+        cprint("\n [bold green]S[/bold green]. Start")
+        cprint(" [bold red]Q[/bold red]. Quit")
 
-        choice = typer.prompt(
+        choice = prompt(
             "\nSelect an option to change, or start/quit", default="S"
         ).lower()
 
@@ -608,6 +809,7 @@ __all__ = [
     "register_cleanup_function",
     "setup_signal_handler",
     "safe_delete",
+    "safe_delete_many",
     "ensure_dir_exists",
     "get_files_by_extension",
     "check_file_exists_with_overwrite",
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 # * Built-in Imports
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Dict
@@ -74,6 +75,11 @@ PACKAGE_INDEX: Dict[str, Tuple[Path, Path]] = {
 # * Root-level global version location.
 ROOT_PYPROJECT: Path = PROJECT_ROOT / "pyproject.toml"
 
+# * Upper bound for concurrent file I/O; small batches are handled serially
+# * because thread start-up would cost more than it saves.
+MAX_IO_WORKERS = 8
+SERIAL_IO_THRESHOLD = 2
+
 # * ---------------------------------------------------------------------------
 # * Helper Enums & Functions
 # * ---------------------------------------------------------------------------
@@ -89,7 +95,15 @@ class BumpScope(str, Enum):
     # * Priority order used when propagating to the global version.
     def precedence(self) -> int:  # noqa: D401 (simple verb phrase)
         """Return precedence value (higher means more significant)."""
-        return {self.MAJOR: 3, self.MINOR: 2, self.PATCH: 1}[self]
+        return _BUMP_PRECEDENCE[self]
+
+
+# * Built once instead of on every precedence() call
+_BUMP_PRECEDENCE: Dict[BumpScope, int] = {
+    BumpScope.MAJOR: 3,
+    BumpScope.MINOR: 2,
+    BumpScope.PATCH: 1,
+}
 
 
 VERSION_RE = re.compile(r"(?P<major>\d+)\.(?P<minor>\d+)\.(?P<patch>\d+)")
@@ -124,46 +138,99 @@ PROJECT_VERSION_LINE_RE = re.compile(
 INIT_VERSION_LINE_RE = re.compile(
     r"^__version__\s*=\s*\"(?P<version>[^\"]+)\"", re.MULTILINE
 )
+# * Any top-level ``version = "..."`` line, including the one inside
+# * ``[tool.littletools]``, so a single scan covers both locations.
+GLOBAL_VERSION_RE = re.compile(r"^version\s*=\s*\"(?P<ver>[^\"]+)\"", re.MULTILINE)
+GLOBAL_VERSION_REPLACE_RE = re.compile(r"([\n\r]version\s*=\s*)\"[^\"]+\"")
 
 
 def read_version_from_pyproject(pyproject_path: Path) -> str:
     """Return current version declared in *pyproject.toml*."""
     text = pyproject_path.read_text(encoding="utf-8")
+    return extract_pyproject_version(text, pyproject_path)
+
+
+def extract_pyproject_version(text: str, pyproject_path: Path) -> str:
+    """Return the version declared in already-read *pyproject.toml* *text*."""
     match = PROJECT_VERSION_LINE_RE.search(text)
     if match is None:
         raise RuntimeError(f"Version line not found in {pyproject_path}")
     return match.group("version")
 
 
+def read_all_versions() -> Dict[str, str]:
+    """Return ``{pkg_name: version}`` for every package in *PACKAGE_INDEX*.
+
+    Files are read concurrently to overlap I/O latency (noticeable on network
+    mounts such as WSL-on-Windows shares).
+    """
+    packages = list(PACKAGE_INDEX)
+    paths = [pyproject_path for pyproject_path, _ in PACKAGE_INDEX.values()]
+    if len(paths) <= SERIAL_IO_THRESHOLD:
+        versions = [read_version_from_pyproject(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(paths))) as ex:
+            versions = list(ex.map(read_version_from_pyproject, paths))
+    return dict(zip(packages, versions))
+
+
 def replace_version_in_file(
     path: Path, pattern: re.Pattern[str], new_version: str
 ) -> None:
     """Replace version line matching *pattern* with *new_version* inside *path*."""
-    text = path.read_text(encoding="utf-8")
-    if pattern.search(text) is None:
+    original = path.read_text(encoding="utf-8")
+    if pattern.search(original) is None:
         # * Insert a new version line at the top if none exists.
         new_line = f'__version__ = "{new_version}"\n'
-        text = new_line + text
+        text = new_line + original
     else:
         text = pattern.sub(
-            lambda m: m.group(0).split("=")[0] + f'= "{new_version}"', text, count=1
+            lambda m: m.group(0).split("=")[0] + f'= "{new_version}"',
+            original,
+            count=1,
         )
-    path.write_text(text, encoding="utf-8")
+    # * Skip the write when nothing changed
+    if text != original:
+        path.write_text(text, encoding="utf-8")
 
 
 def update_package_version(
-    pyproject_path: Path, init_path: Path, new_version: str
+    pyproject_path: Path,
+    init_path: Path,
+    new_version: str,
+    *,
+    current_text: str | None = None,
 ) -> None:
-    """Update *pyproject.toml* and *__init__.py* with *new_version*."""
+    """Update *pyproject.toml* and *__init__.py* with *new_version*.
+
+    Pass *current_text* when the pyproject contents were already read to
+    avoid reading the file a second time.
+    """
     # * Update pyproject
-    text = pyproject_path.read_text(encoding="utf-8")
-    text = PROJECT_VERSION_LINE_RE.sub(f'version = "{new_version}"', text, count=1)
-    pyproject_path.write_text(text, encoding="utf-8")
+    text = (
+        current_text
+        if current_text is not None
+        else pyproject_path.read_text(encoding="utf-8")
+    )
+    new_text = PROJECT_VERSION_LINE_RE.sub(f'version = "{new_version}"', text, count=1)
+    if new_text != text:
+        pyproject_path.write_text(new_text, encoding="utf-8")
 
     # * Update __init__.py
     replace_version_in_file(init_path, INIT_VERSION_LINE_RE, new_version)
 
 
+def bump_package(pkg: str, scope: BumpScope) -> Tuple[str, str]:
+    """Bump *pkg* by *scope* on disk and return ``(old_version, new_version)``."""
+    pyproject_path, init_path = PACKAGE_INDEX[pkg]
+    # * Read once and reuse the text for the update below
+    text = pyproject_path.read_text(encoding="utf-8")
+    current_version = extract_pyproject_version(text, pyproject_path)
+    new_version = bump_version(current_version, scope)
+    update_package_version(pyproject_path, init_path, new_version, current_text=text)
+    return current_version, new_version
+
+
 # * ---------------------------------------------------------------------------
 # * CLI – powered by Typer                                                      *
 # * ---------------------------------------------------------------------------
@@ -185,29 +252,36 @@ def main(ctx: typer.Context):
         ctx.invoke(bump)
 
 
-@app.command("list")
-def show_versions() -> None:  # noqa: D401 (simple verb phrase)
-    """Print a table of current package versions."""
+def render_versions_table(versions: Dict[str, str], global_version: str) -> None:
+    """Print *versions* and *global_version* as a single table."""
     table = Table(title="LittleTools Package Versions")
     table.add_column("Index", style="cyan", no_wrap=True)
     table.add_column("Package")
     table.add_column("Version", style="green")
-    for idx, (pkg, (pyproject_path, _)) in enumerate(PACKAGE_INDEX.items(), start=1):
-        version = read_version_from_pyproject(pyproject_path)
+    for idx, (pkg, version) in enumerate(versions.items(), start=1):
         table.add_row(str(idx), pkg, version)
     # * Global version
-    global_version = get_global_version()
     table.add_row(
         "-", "[b]GLOBAL[/b]", f"[bright_yellow]{global_version}[/bright_yellow]"
     )
     console.print(table)
 
 
+@app.command("list")
+def show_versions() -> Dict[str, str]:  # noqa: D401 (simple verb phrase)
+    """Print a table of current package versions."""
+    versions = read_all_versions()
+    render_versions_table(versions, get_global_version())
+    return versions
+
+
 @app.command()
 def bump() -> None:  # noqa: D401 (simple verb phrase)
     """Interactive version bump menu."""
-    # * Show current versions first
-    show_versions()
+    # * Show current versions first; keep them to render the final table
+    versions = read_all_versions()
+    global_version = get_global_version()
+    render_versions_table(versions, global_version)
 
     # * Prompt user for packages
     selection = typer.prompt(
@@ -244,13 +318,18 @@ def bump() -> None:  # noqa: D401 (simple verb phrase)
             raise typer.Exit(code=1)
         bump_decisions[pkg] = scope
 
-    # * Execute bumps
+    # * Execute bumps; every package lives in its own directory, so the
+    # * file updates are independent and can run concurrently.
+    items = list(bump_decisions.items())
+    if len(items) <= SERIAL_IO_THRESHOLD:
+        results = [bump_package(pkg, scope) for pkg, scope in items]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(items))) as ex:
+            results = list(ex.map(lambda item: bump_package(*item), items))
+
     highest_scope: BumpScope | None = None
-    for pkg, scope in bump_decisions.items():
-        pyproject_path, init_path = PACKAGE_INDEX[pkg]
-        current_version = read_version_from_pyproject(pyproject_path)
-        new_version = bump_version(current_version, scope)
-        update_package_version(pyproject_path, init_path, new_version)
+    for (pkg, scope), (current_version, new_version) in zip(items, results):
+        versions[pkg] = new_version
         typer.echo(f"[UPDATED] {pkg}: {current_version} -> {new_version}")
 
         # * Track highest scope
@@ -259,11 +338,12 @@ def bump() -> None:  # noqa: D401 (simple verb phrase)
 
     # * Bump global version accordingly
     if highest_scope is not None:
-        bump_global_version(highest_scope)
+        global_version = bump_global_version(highest_scope)
         typer.echo("Global version updated.")
 
+    # * Built from in-memory results; no need to re-read every pyproject
     typer.echo("\nDone! New versions:")
-    show_versions()
+    render_versions_table(versions, global_version)
 
 
 # * ---------------------------------------------------------------------------
@@ -274,24 +354,17 @@ def bump() -> None:  # noqa: D401 (simple verb phrase)
 def get_global_version() -> str:
     """Return global LittleTools version defined in root `pyproject.toml`."""
     content = ROOT_PYPROJECT.read_text(encoding="utf-8")
-    match = re.search(
-        r"^version\s*=\s*\"(?P<ver>[^\"]+)\"", content, flags=re.MULTILINE
-    )
+    match = GLOBAL_VERSION_RE.search(content)
     if match:
         return match.group("ver")
-    # * Fallback to custom section
-    m2 = re.search(
-        r"^\[tool.littletools\][^\n]*\nversion\s*=\s*\"(?P<ver>[^\"]+)\"",
-        content,
-        flags=re.MULTILINE,
-    )
-    if m2:
-        return m2.group("ver")
     raise RuntimeError("Global version not found in root pyproject.toml")
 
 
-def bump_global_version(scope: BumpScope) -> None:
-    """Apply *scope* bump to global version in root `pyproject.toml`."""
+def bump_global_version(scope: BumpScope) -> str:
+    """Apply *scope* bump to global version in root `pyproject.toml`.
+
+    Returns the new global version.
+    """
     current = get_global_version()
     new_version = bump_version(current, scope)
     text = ROOT_PYPROJECT.read_text(encoding="utf-8")
@@ -299,13 +372,11 @@ def bump_global_version(scope: BumpScope) -> None:
         # * Append section if missing.
         text += f'\n[tool.littletools]\nversion = "{new_version}"\n'
     else:
-        text = re.sub(
-            r"([\n\r]version\s*=\s*)\"[^\"]+\"",
-            lambda m: m.group(1) + f'"{new_version}"',
-            text,
-            count=1,
+        text = GLOBAL_VERSION_REPLACE_RE.sub(
+            lambda m: m.group(1) + f'"{new_version}"', text, count=1
         )
     ROOT_PYPROJECT.write_text(text, encoding="utf-8")
+    return new_version
 
 
 # * ---------------------------------------------------------------------------
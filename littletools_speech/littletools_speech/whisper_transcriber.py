@@ -5,19 +5,46 @@ Whisper Transcriber Tool
 
 A Typer-based CLI tool to transcribe audio and video files using OpenAI's Whisper model.
 This script is designed to be a plugin for the 'littletools-cli'.
+
+Inference runs on faster-whisper (CTranslate2) with int8 weights, which is
+several times faster than the reference PyTorch implementation and needs
+roughly half the VRAM for the same accuracy.
+
+For repeated batches, 'serve' keeps the model loaded in a long-running worker
+and 'submit' sends directories to it, avoiding the model load on every run.
 """
 
+import json
+import os
+import secrets
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from multiprocessing.connection import Listener
 from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
 
 import torch
 import typer
-import whisper
+from faster_whisper import BatchedInferencePipeline
+from faster_whisper import WhisperModel
+from faster_whisper import decode_audio
+from faster_whisper.transcribe import Segment
+from faster_whisper.transcribe import TranscriptionInfo
 from rich.console import Console
 from tqdm import tqdm
 from typing_extensions import Annotated
 
 from littletools_core.huggingface_utils import download_hf_model
 from littletools_core.utils import ensure_dir_exists
+from littletools_core.utils import get_files_by_extension
 from littletools_core.utils import setup_signal_handler
 
 app = typer.Typer(
@@ -45,17 +72,332 @@ SUPPORTED_EXTENSIONS = [
 ]
 
 # * Map friendly model names to Hugging Face Hub repository IDs
+# * (CTranslate2 conversions of the official OpenAI checkpoints)
 WHISPER_HF_MODELS = {
-    "tiny": "openai/whisper-tiny",
-    "base": "openai/whisper-base",
-    "small": "openai/whisper-small",
-    "medium": "openai/whisper-medium",
-    "large": "openai/whisper-large",
-    "large-v1": "openai/whisper-large",
-    "large-v2": "openai/whisper-large-v2",
-    "large-v3": "openai/whisper-large-v3",
+    "tiny": "Systran/faster-whisper-tiny",
+    "base": "Systran/faster-whisper-base",
+    "small": "Systran/faster-whisper-small",
+    "medium": "Systran/faster-whisper-medium",
+    "large": "Systran/faster-whisper-large-v1",
+    "large-v1": "Systran/faster-whisper-large-v1",
+    "large-v2": "Systran/faster-whisper-large-v2",
+    "large-v3": "Systran/faster-whisper-large-v3",
 }
 
+# * int8 weights with fp16 activations on GPU, pure int8 on CPU
+COMPUTE_TYPES = {"cuda": "int8_float16", "cpu": "int8"}
+# * Precisions accepted by CTranslate2 for --compute-type overrides. bfloat16
+# * variants suit Ampere+ GPUs, where bf16 Tensor Core math matches fp16 speed.
+VALID_COMPUTE_TYPES = (
+    "auto",
+    "int8",
+    "int8_float32",
+    "int8_float16",
+    "int8_bfloat16",
+    "int16",
+    "float16",
+    "bfloat16",
+    "float32",
+)
+
+# * CTranslate2 caps CPU inference at 4 threads unless told otherwise; the int8
+# * GEMMs scale with cores, so use all of them on the CPU path
+CPU_THREADS = os.cpu_count() or 0
+
+# * Persistent worker ('serve'/'submit') settings. The listener is bound to
+# * localhost only and authenticates clients with a random per-user key kept
+# * in a 0600 file; messages are JSON, so nothing received is ever unpickled.
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 47813
+SERVER_KEY_FILE = Path.home() / ".cache" / "littletools" / "whisper_worker.key"
+SERVER_MAX_MESSAGE_BYTES = 1 << 20
+
+# --- Output Writers ---
+
+
+def _format_timestamp(seconds: float, decimal_marker: str = ".") -> str:
+    """Format *seconds* as ``HH:MM:SS.mmm`` (SRT uses ``,`` as the marker)."""
+    milliseconds = round(seconds * 1000.0)
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    secs, milliseconds = divmod(milliseconds, 1_000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal_marker}{milliseconds:03d}"
+
+
+def _write_txt(segments: List[Segment], info: TranscriptionInfo, f: TextIO) -> None:
+    for segment in segments:
+        f.write(segment.text.strip() + "\n")
+
+
+def _write_srt(segments: List[Segment], info: TranscriptionInfo, f: TextIO) -> None:
+    for index, segment in enumerate(segments, start=1):
+        start = _format_timestamp(segment.start, ",")
+        end = _format_timestamp(segment.end, ",")
+        f.write(f"{index}\n{start} --> {end}\n{segment.text.strip()}\n\n")
+
+
+def _write_vtt(segments: List[Segment], info: TranscriptionInfo, f: TextIO) -> None:
+    f.write("WEBVTT\n\n")
+    for segment in segments:
+        start = _format_timestamp(segment.start)
+        end = _format_timestamp(segment.end)
+        f.write(f"{start} --> {end}\n{segment.text.strip()}\n\n")
+
+
+def _write_tsv(segments: List[Segment], info: TranscriptionInfo, f: TextIO) -> None:
+    # * Same layout as openai-whisper: integer milliseconds, tabs in text removed
+    f.write("start\tend\ttext\n")
+    for segment in segments:
+        start, end = round(1000 * segment.start), round(1000 * segment.end)
+        text = segment.text.strip().replace("\t", " ")
+        f.write(f"{start}\t{end}\t{text}\n")
+
+
+def _write_json(segments: List[Segment], info: TranscriptionInfo, f: TextIO) -> None:
+    result: Dict[str, Any] = {
+        "text": "".join(segment.text for segment in segments),
+        "segments": [
+            {
+                "id": segment.id,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "no_speech_prob": segment.no_speech_prob,
+            }
+            for segment in segments
+        ],
+        "language": info.language,
+    }
+    json.dump(result, f, ensure_ascii=False)
+
+
+WRITERS: Dict[str, Callable[[List[Segment], TranscriptionInfo, TextIO], None]] = {
+    "txt": _write_txt,
+    "srt": _write_srt,
+    "vtt": _write_vtt,
+    "tsv": _write_tsv,
+    "json": _write_json,
+}
+
+
+def output_formats(output_format: str) -> List[str]:
+    """Expand an ``--output-format`` value into the concrete writer formats."""
+    return list(WRITERS) if output_format == "all" else [output_format]
+
+
+def write_transcription(
+    segments: List[Segment],
+    info: TranscriptionInfo,
+    output_dir: Path,
+    stem: str,
+    output_format: str,
+) -> None:
+    """Write *segments* to ``output_dir/stem.<ext>`` for the requested format(s)."""
+    for fmt in output_formats(output_format):
+        with open(output_dir / f"{stem}.{fmt}", "w", encoding="utf-8") as f:
+            WRITERS[fmt](segments, info, f)
+
+
+# --- Inference Helpers ---
+
+
+class WhisperEngine:
+    """A loaded Whisper model plus the settings used to run it."""
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str,
+        batch_size: int,
+        compute_type: Optional[str] = None,
+    ) -> None:
+        if device == "cuda" and not torch.cuda.is_available():
+            console.print(
+                "[red]! CUDA device selected, but it is not available. Aborting.[/red]"
+            )
+            raise typer.Exit(code=1)
+
+        # * Resolve model name to a Hugging Face Hub repo ID
+        repo_id = WHISPER_HF_MODELS.get(model_name.lower())
+        if not repo_id:
+            console.print(f"[red]! Invalid model name: '{model_name}'[/red]")
+            console.print(f"  Available models: {', '.join(WHISPER_HF_MODELS.keys())}")
+            raise typer.Exit(code=1)
+
+        if compute_type is None:
+            compute_type = COMPUTE_TYPES.get(device, "int8")
+        elif compute_type not in VALID_COMPUTE_TYPES:
+            console.print(f"[red]! Invalid compute type: '{compute_type}'[/red]")
+            console.print(f"  Available types: {', '.join(VALID_COMPUTE_TYPES)}")
+            raise typer.Exit(code=1)
+
+        try:
+            # * Download the model from Hugging Face Hub, which returns the local path
+            model_path = download_hf_model(repo_id=repo_id)
+            self.model = WhisperModel(
+                str(model_path),
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=CPU_THREADS if device == "cpu" else 0,
+                num_workers=1,
+            )
+            console.print(
+                f"[*] Whisper model '{model_name}' loaded successfully from local path."
+            )
+            # * Batched pipeline splits audio into VAD chunks (~30 s) and decodes
+            # * them in parallel batches, keeping the GPU busy between decoder steps.
+            self.batched_model: Optional[BatchedInferencePipeline] = (
+                BatchedInferencePipeline(model=self.model) if batch_size > 1 else None
+            )
+        except Exception as e:
+            console.print(f"[red]! Failed to load Whisper model: {e}[/red]")
+            raise typer.Exit(code=1)
+
+        self.batch_size = batch_size
+
+    def transcribe(
+        self, audio: Any, language: str, without_timestamps: bool = False
+    ) -> Tuple[List[Segment], TranscriptionInfo]:
+        """Transcribe a decoded waveform (or path) and return all segments."""
+        # * A fixed language skips detection; the batched pipeline always
+        # * decodes without timestamp tokens and times segments from VAD chunks
+        if self.batched_model is not None:
+            segments_iter, info = self.batched_model.transcribe(
+                audio,
+                language=language,
+                beam_size=1,
+                vad_filter=True,
+                temperature=0.25,
+                batch_size=self.batch_size,
+            )
+        else:
+            segments_iter, info = self.model.transcribe(
+                audio,
+                language=language,
+                beam_size=1,
+                vad_filter=True,
+                temperature=0.25,
+                without_timestamps=without_timestamps,
+            )
+        # ! `segments_iter` is lazy: decoding only happens while consuming it
+        return list(segments_iter), info
+
+
+def find_pending_files(
+    input_dir: Path, output_dir: Path, output_format: str, overwrite: bool
+) -> List[Path]:
+    """Return supported media files in *input_dir* that still need transcribing."""
+    files_to_process = get_files_by_extension(input_dir, SUPPORTED_EXTENSIONS)
+
+    if not files_to_process:
+        console.print("[yellow]! No supported media files found.[/yellow]")
+        return []
+
+    console.print(f"[*] Found {len(files_to_process)} media file(s) to process.")
+
+    # * A file counts as done only when every requested output exists, so an
+    # * interrupted "all" run is resumed instead of silently skipped
+    formats = output_formats(output_format)
+    pending: List[Path] = []
+    for file_path in files_to_process:
+        if not overwrite:
+            if all(
+                (output_dir / f"{file_path.stem}.{fmt}").exists() for fmt in formats
+            ):
+                console.print(
+                    f"[yellow]  -> Skipping {file_path.name} (output exists and --overwrite is not set).[/yellow]"
+                )
+                continue
+        pending.append(file_path)
+    return pending
+
+
+def transcribe_files(
+    engine: WhisperEngine,
+    files: List[Path],
+    output_dir: Path,
+    output_format: str,
+    language: str,
+) -> Dict[str, Optional[str]]:
+    """Transcribe *files* and return ``{file_name: error_or_None}``."""
+    results: Dict[str, Optional[str]] = {}
+    # * Plain text never shows timings, so skip decoding timestamp tokens for it
+    without_timestamps = output_format == "txt"
+    # * At most one file's outputs are in flight on the writer thread
+    pending_write: Optional[Tuple[Path, "Future[None]"]] = None
+
+    def finish_pending_write() -> None:
+        nonlocal pending_write
+        if pending_write is None:
+            return
+        written_path, write_future = pending_write
+        pending_write = None
+        try:
+            write_future.result()
+            console.print(
+                f"\n  -> [green]✓ Transcription successful for {written_path.name}.[/green] Output format(s): {output_format}"
+            )
+            results[written_path.name] = None
+        except Exception as e:
+            console.print(
+                f"\n  -> [red]✗ Error writing output for {written_path.name}: {e}[/red]"
+            )
+            results[written_path.name] = str(e)
+
+    # * Decode (FFmpeg + 16 kHz resample) the next file on a worker thread while
+    # * the current one is transcribed, so audio decoding and feature
+    # * preparation overlap with inference instead of stalling the GPU.
+    # * Outputs are written on a second thread so the next file's inference
+    # * starts without waiting on disk I/O.
+    with ThreadPoolExecutor(1) as audio_loader, ThreadPoolExecutor(1) as output_writer:
+        next_audio = audio_loader.submit(decode_audio, str(files[0])) if files else None
+        progress_bar = tqdm(files, desc="Transcribing files", unit="file")
+        for index, file_path in enumerate(progress_bar):
+            progress_bar.set_description(f"Processing {file_path.name}")
+
+            audio_future = next_audio
+            next_audio = (
+                audio_loader.submit(decode_audio, str(files[index + 1]))
+                if index + 1 < len(files)
+                else None
+            )
+
+            try:
+                audio = audio_future.result()
+                segments, info = engine.transcribe(audio, language, without_timestamps)
+                del audio
+
+                finish_pending_write()
+                pending_write = (
+                    file_path,
+                    output_writer.submit(
+                        write_transcription,
+                        segments,
+                        info,
+                        output_dir,
+                        file_path.stem,
+                        output_format,
+                    ),
+                )
+
+            except Exception as e:
+                console.print(
+                    f"\n  -> [red]✗ Error during transcription for {file_path.name}: {e}[/red]"
+                )
+                results[file_path.name] = str(e)
+
+        finish_pending_write()
+
+    return results
+
+
+def _validate_output_format(output_format: str) -> None:
+    if output_format != "all" and output_format not in WRITERS:
+        console.print(f"[red]! Invalid output format: '{output_format}'[/red]")
+        raise typer.Exit(code=1)
+
+
 # --- Main Command ---
 
 
@@ -79,7 +421,7 @@ def run(
         str,
         typer.Option(
             "--format",
-            help="Output format for the transcription. [all|srt|vtt|txt|json]",
+            help="Output format for the transcription. [all|srt|vtt|txt|tsv|json]",
         ),
     ] = "all",
     language: Annotated[
@@ -91,6 +433,21 @@ def run(
     device: Annotated[
         str, typer.Option(help="Device to use for inference ('cpu' or 'cuda').")
     ] = "cuda",
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size",
+            help="VAD chunks decoded together per batch. 1 disables batching.",
+            min=1,
+        ),
+    ] = 16,
+    compute_type: Annotated[
+        Optional[str],
+        typer.Option(
+            "--compute-type",
+            help="CTranslate2 precision, e.g. 'bfloat16' or 'int8_bfloat16'. Defaults to int8_float16 on CUDA and int8 on CPU.",
+        ),
+    ] = None,
 ):
     """
     Transcribe all supported media files in a directory using Whisper.
@@ -103,76 +460,231 @@ def run(
     )
     console.print(f"[*] Input: '{input_dir}', Output: '{output_dir}'")
 
-    if device == "cuda" and not torch.cuda.is_available():
-        console.print(
-            "[red]! CUDA device selected, but it is not available. Aborting.[/red]"
-        )
-        raise typer.Exit(code=1)
+    _validate_output_format(output_format)
 
-    # * Resolve model name to a Hugging Face Hub repo ID
-    repo_id = WHISPER_HF_MODELS.get(model_name.lower())
-    if not repo_id:
-        console.print(f"[red]! Invalid model name: '{model_name}'[/red]")
-        console.print(f"  Available models: {', '.join(WHISPER_HF_MODELS.keys())}")
-        raise typer.Exit(code=1)
+    files_to_process = find_pending_files(
+        input_dir, output_dir, output_format, overwrite
+    )
+    if not files_to_process:
+        raise typer.Exit()
+
+    engine = WhisperEngine(model_name, device, batch_size, compute_type)
+
+    transcribe_files(engine, files_to_process, output_dir, output_format, language)
+
+    console.print("\n[green]✓ Transcription process completed.[/green]")
+
+
+# --- Persistent Worker ---
+
+
+def _load_server_authkey(create: bool = False) -> bytes:
+    """
+    Return this user's worker auth key, creating it on first 'serve'.
 
+    Raises:
+        FileNotFoundError: If the key does not exist and *create* is False
+    """
     try:
-        # * Download the model from Hugging Face Hub, which returns the local path
-        model_path = download_hf_model(repo_id=repo_id)
-        model = whisper.load_model(model_path, device=device)
-        console.print(
-            f"[*] Whisper model '{model_name}' loaded successfully from local path."
-        )
-    except Exception as e:
-        console.print(f"[red]! Failed to load Whisper model: {e}[/red]")
-        raise typer.Exit(code=1)
+        return SERVER_KEY_FILE.read_bytes()
+    except FileNotFoundError:
+        if not create:
+            raise
+    ensure_dir_exists(SERVER_KEY_FILE.parent)
+    key = secrets.token_bytes(32)
+    try:
+        # * O_EXCL + 0600: never reuse a file planted by someone else
+        fd = os.open(SERVER_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return SERVER_KEY_FILE.read_bytes()  # * Created concurrently
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
 
-    files_to_process = sorted(
-        [p for p in input_dir.iterdir() if p.suffix.lower() in SUPPORTED_EXTENSIONS]
+def _send_message(conn: Any, message: Dict[str, Any]) -> None:
+    conn.send_bytes(json.dumps(message).encode("utf-8"))
+
+
+def _recv_message(conn: Any) -> Dict[str, Any]:
+    message = json.loads(conn.recv_bytes(SERVER_MAX_MESSAGE_BYTES).decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Request must be a JSON object")
+    return message
+
+
+def _handle_transcribe_request(
+    engine: WhisperEngine, request: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run one 'submit' request on the resident engine."""
+    input_dir = Path(request["input_dir"])
+    output_dir = Path(request["output_dir"])
+    output_format = request["output_format"]
+    language = request["language"]
+    if not input_dir.is_dir():
+        raise ValueError(f"Input directory not found: {input_dir}")
+    if output_format != "all" and output_format not in WRITERS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    ensure_dir_exists(output_dir)
+    files = find_pending_files(
+        input_dir, output_dir, output_format, bool(request.get("overwrite"))
     )
+    results = transcribe_files(engine, files, output_dir, output_format, language)
+    return {"status": "done", "results": results}
 
-    if not files_to_process:
-        console.print("[yellow]! No supported media files found.[/yellow]")
-        raise typer.Exit()
 
-    console.print(f"[*] Found {len(files_to_process)} media file(s) to process.")
+@app.command()
+def serve(
+    model_name: Annotated[
+        str,
+        typer.Option(
+            "--model", help="Name of the Whisper model to use (e.g., 'large-v3')."
+        ),
+    ] = "large-v3",
+    device: Annotated[
+        str, typer.Option(help="Device to use for inference ('cpu' or 'cuda').")
+    ] = "cuda",
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size",
+            help="VAD chunks decoded together per batch. 1 disables batching.",
+            min=1,
+        ),
+    ] = 16,
+    compute_type: Annotated[
+        Optional[str],
+        typer.Option(
+            "--compute-type",
+            help="CTranslate2 precision, e.g. 'bfloat16' or 'int8_bfloat16'. Defaults to int8_float16 on CUDA and int8 on CPU.",
+        ),
+    ] = None,
+    port: Annotated[
+        int, typer.Option(help="Localhost port to listen on for 'submit' requests.")
+    ] = SERVER_PORT,
+):
+    """
+    Load the Whisper model once and keep it resident, serving 'submit' requests.
+    """
+    authkey = _load_server_authkey(create=True)
+    engine = WhisperEngine(model_name, device, batch_size, compute_type)
 
-    progress_bar = tqdm(files_to_process, desc="Transcribing files", unit="file")
-    for file_path in progress_bar:
-        progress_bar.set_description(f"Processing {file_path.name}")
+    with Listener((SERVER_HOST, port), authkey=authkey) as listener:
+        console.print(
+            f"[*] Whisper worker listening on {SERVER_HOST}:{port}. Press Ctrl+C to stop."
+        )
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, OSError, EOFError) as e:
+                console.print(f"[yellow]! Rejected connection: {e}[/yellow]")
+                continue
 
-        # Check for existing files
-        output_exists = False
-        if not overwrite:
-            # A simple check for the .txt file. A more robust check would consider all formats.
-            if (output_dir / f"{file_path.stem}.txt").exists():
-                output_exists = True
+            # ! A bad request or a dropped client must not stop the worker
+            with conn:
+                try:
+                    request = _recv_message(conn)
+                    if request.get("command") == "shutdown":
+                        _send_message(conn, {"status": "stopped"})
+                        break
+                    response = _handle_transcribe_request(engine, request)
+                except (EOFError, OSError) as e:
+                    console.print(f"[yellow]! Client disconnected: {e}[/yellow]")
+                    continue
+                except KeyError as e:
+                    response = {"status": "error", "error": f"Missing field {e}"}
+                except Exception as e:
+                    response = {"status": "error", "error": str(e)}
 
-        if output_exists:
-            console.print(
-                f"[yellow]  -> Skipping (output exists and --overwrite is not set).[/yellow]"
-            )
-            continue
+                try:
+                    _send_message(conn, response)
+                except (EOFError, OSError) as e:
+                    console.print(f"[yellow]! Client disconnected: {e}[/yellow]")
 
-        try:
-            # * The 'verbose=False' is recommended when using a progress bar like tqdm
-            result = model.transcribe(
-                str(file_path), language=language, verbose=False, temperature=0.25
-            )
+    console.print("[*] Whisper worker stopped.")
 
-            writer = whisper.utils.get_writer(output_format, str(output_dir))
-            writer(result, str(file_path.stem))
 
-            console.print(
-                f"\n  -> [green]✓ Transcription successful for {file_path.name}.[/green] Output format(s): {output_format}"
-            )
+@app.command()
+def submit(
+    input_dir: Annotated[
+        Path,
+        typer.Option("--input", "-i", help="Input directory containing media files."),
+    ] = INPUT_DIR,
+    output_dir: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="Output directory for transcriptions."),
+    ] = OUTPUT_DIR,
+    output_format: Annotated[
+        str,
+        typer.Option(
+            "--format",
+            help="Output format for the transcription. [all|srt|vtt|txt|tsv|json]",
+        ),
+    ] = "all",
+    language: Annotated[
+        str, typer.Option(help="Language spoken in the audio. (e.g., 'en', 'ru')")
+    ] = "ru",
+    overwrite: Annotated[
+        bool, typer.Option(help="Overwrite existing transcription files.")
+    ] = False,
+    port: Annotated[
+        int, typer.Option(help="Port of the running 'serve' worker.")
+    ] = SERVER_PORT,
+    shutdown: Annotated[
+        bool, typer.Option(help="Ask the running worker to stop instead.")
+    ] = False,
+):
+    """
+    Send a directory to a running 'serve' worker and wait for the results.
+    """
+    if shutdown:
+        request: Dict[str, Any] = {"command": "shutdown"}
+    else:
+        _validate_output_format(output_format)
+        ensure_dir_exists(input_dir)
+        request = {
+            "command": "transcribe",
+            "input_dir": str(input_dir.resolve()),
+            "output_dir": str(output_dir.resolve()),
+            "output_format": output_format,
+            "language": language,
+            "overwrite": overwrite,
+        }
 
-        except Exception as e:
-            console.print(
-                f"\n  -> [red]✗ Error during transcription for {file_path.name}: {e}[/red]"
-            )
+    try:
+        authkey = _load_server_authkey()
+        with Client((SERVER_HOST, port), authkey=authkey) as conn:
+            _send_message(conn, request)
+            response = _recv_message(conn)
+    except (ConnectionRefusedError, FileNotFoundError):
+        console.print(
+            f"[red]! No Whisper worker on port {port}. Start one with 'serve'.[/red]"
+        )
+        raise typer.Exit(code=1)
+    except AuthenticationError:
+        console.print(
+            f"[red]! The process on port {port} rejected this user's worker key.[/red]"
+        )
+        raise typer.Exit(code=1)
 
-    console.print("\n[green]✓ Transcription process completed.[/green]")
+    if response.get("status") == "error":
+        console.print(f"[red]! Worker error: {response.get('error')}[/red]")
+        raise typer.Exit(code=1)
+
+    if shutdown:
+        console.print("[*] Whisper worker stopped.")
+        return
+
+    results: Dict[str, Optional[str]] = response.get("results", {})
+    failed = {name: error for name, error in results.items() if error}
+    console.print(
+        f"\n[green]✓ {len(results) - len(failed)} file(s) transcribed.[/green]"
+    )
+    for name, error in failed.items():
+        console.print(f"  [red]✗ {name}: {error}[/red]")
+    if failed:
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
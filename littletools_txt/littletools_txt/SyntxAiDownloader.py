@@ -39,14 +39,36 @@ console = Console()
 
 OUTPUT_DIR = Path.cwd() / "0-OUTPUT-0"
 
+# * lxml is a C parser and much faster than the pure-Python html.parser on long pages
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# * Seconds to wait for the server before giving up on a request
+REQUEST_TIMEOUT = 15
+
+# * Shared session so repeated downloads reuse the TCP/TLS connection
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """Return the module-wide HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 
 def download_syntx_content(url: str, output_path: Path):
     """Downloads content from the given Syntx.ai URL."""
     try:
-        response = requests.get(url)
+        response = _get_session().get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, HTML_PARSER)
 
         title_element = soup.find("h1", class_="text-lg")
         title = title_element.text.strip() if title_element else "Untitled"
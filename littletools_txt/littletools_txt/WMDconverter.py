@@ -17,6 +17,7 @@ A Typer-based CLI tool to convert files between .docx and .md formats using pand
 This script is designed to be a plugin for the 'littletools-cli'.
 """
 
+import subprocess
 from pathlib import Path
 from typing import Optional
 
@@ -53,12 +54,26 @@ def do_conversion(input_path: Path, output_path: Path, media_dir: Path):
         console.print(
             f"[*] Converting '{input_path.name}' ({from_format}) -> '{output_path.name}' ({to_format})..."
         )
-        pypandoc.convert_file(
+        # * Call pandoc directly: pypandoc.convert_file first spawns extra pandoc
+        # * processes to list and validate formats, multiplying startup cost
+        command = [
+            pypandoc.get_pandoc_path(),
             str(input_path),
+            "--from",
+            from_format,
+            "--to",
             to_format,
-            outputfile=str(output_path),
-            extra_args=extra_args,
+            "--output",
+            str(output_path),
+            *extra_args,
+        ]
+        result = subprocess.run(
+            command, capture_output=True, encoding="utf-8", errors="replace"
         )
+        if result.returncode != 0:
+            raise RuntimeError(
+                result.stderr.strip() or f"pandoc exited with code {result.returncode}"
+            )
         console.print(
             f"[green]✓ Conversion successful.[/green] Media saved to '{media_dir.name}'."
         )
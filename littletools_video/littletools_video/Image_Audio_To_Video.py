@@ -17,19 +17,30 @@ This script is designed to be a plugin for the 'littletools-cli'.
 """
 
 import asyncio
+import csv
+import json
+import os
+import struct
 from pathlib import Path
+from typing import BinaryIO
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 import typer
-from PIL import Image
 from rich.console import Console
 from typing_extensions import Annotated
 
 from littletools_core.utils import ensure_dir_exists
 from littletools_core.utils import get_platform_info
+from littletools_core.utils import run_tasks_with_semaphore
 from littletools_core.utils import setup_signal_handler
 from littletools_video.ffmpeg_utils import ProcessingStats
+from littletools_video.ffmpeg_utils import clamp_nvenc_concurrency
+from littletools_video.ffmpeg_utils import get_nvenc_video_options
 from littletools_video.ffmpeg_utils import get_video_duration
+from littletools_video.ffmpeg_utils import is_nvenc_available
 from littletools_video.ffmpeg_utils import run_ffmpeg_command
 
 app = typer.Typer(
@@ -41,53 +52,170 @@ console = Console()
 
 OUTPUT_DIR = Path.cwd() / "0-OUTPUT-0"
 
+# * NVENC constant quality; repeated frames make a low CQ nearly free in bitrate
+NVENC_QUALITY = "18"
+# * CPU fallback for machines without an NVIDIA GPU
+X264_VIDEO_OPTIONS = [
+    "-c:v",
+    "libx264",
+    "-preset",
+    "medium",
+    "-tune",
+    "stillimage",
+    "-crf",
+    "18",
+]
+SUPPORTED_CODECS = ("h264", "hevc", "x264")
 
-async def create_video(image_path: Path, audio_path: Path, output_path: Path):
-    """Asynchronously creates the video using FFmpeg."""
+# * The still image is converted to YUV exactly once, so the most accurate
+# * swscale settings are free: full-precision chroma and BT.709 coefficients
+STILL_IMAGE_FILTER = (
+    "scale=flags=lanczos+accurate_rnd+full_chroma_int+full_chroma_inp"
+    ":out_color_matrix=bt709,format=yuv420p,loop=loop=-1:size=1:start=0"
+)
+# * Tag the stream so players decode it with the matrix it was encoded with
+BT709_TAGS = [
+    "-colorspace",
+    "bt709",
+    "-color_primaries",
+    "bt709",
+    "-color_trc",
+    "bt709",
+]
+
+# * JPEG start-of-frame markers carrying the image size (C4, C8 and CC are not SOF)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _peek_jpeg_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    """Walk JPEG marker segments up to the first SOF and read its size."""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)  # * Skip fill bytes before the marker code
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue  # * Standalone markers have no length field
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        (length,) = struct.unpack(">H", segment)
+        if marker in JPEG_SOF_MARKERS:
+            header = f.read(5)
+            if len(header) < 5:
+                return None
+            height, width = struct.unpack(">xHH", header)
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def _peek_image_size(image_path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) straight from a PNG, JPEG or WebP header.
+
+    Returns None for other formats or unexpected headers, so callers can fall
+    back to a full image library.
+    """
+    with open(image_path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return width, height
+        if head.startswith(b"\xff\xd8"):
+            return _peek_jpeg_size(f)
+        if len(head) == 32 and head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+            chunk = head[12:16]
+            if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+                width, height = struct.unpack("<HH", head[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L" and head[20] == 0x2F:
+                (bits,) = struct.unpack("<I", head[21:25])
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                width = int.from_bytes(head[24:27], "little") + 1
+                height = int.from_bytes(head[27:30], "little") + 1
+                return width, height
+    return None
+
+
+async def create_video(
+    image_path: Path, audio_path: Path, output_path: Path, codec: str = "h264"
+) -> bool:
+    """Asynchronously creates the video using FFmpeg. Returns True on success."""
     stats = ProcessingStats()
 
     try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            if width % 2 != 0 or height % 2 != 0:
-                console.print(
-                    "[yellow]! Warning: Image dimensions are not even. This may cause issues with some video codecs.[/yellow]"
-                )
+        # * A header read avoids loading the image through Pillow's plugin stack
+        size = _peek_image_size(image_path)
+        if size is None:
+            # * Pillow is only imported for formats the header peek cannot read
+            from PIL import Image
+
+            with Image.open(image_path) as img:
+                size = img.size
+        width, height = size
     except Exception as e:
         console.print(f"[red]! Could not read image dimensions: {e}[/red]")
-        raise typer.Exit(code=1)
+        return False
+
+    # * yuv420p needs even dimensions; drop the odd edge row/column with integer
+    # * math instead of letting the encoder reject the stream. A 1-pixel side
+    # * cannot be cropped, so it is padded up to 2 instead
+    video_filter = STILL_IMAGE_FILTER
+    even_width, even_height = max(width & ~1, 2), max(height & ~1, 2)
+    if (even_width, even_height) != (width, height):
+        console.print(
+            f"[yellow]! Image dimensions {width}x{height} are not even, adjusting to {even_width}x{even_height}.[/yellow]"
+        )
+        crop_width, crop_height = min(width, even_width), min(height, even_height)
+        video_filter = f"crop={crop_width}:{crop_height}:0:0,"
+        if (crop_width, crop_height) != (even_width, even_height):
+            video_filter += f"pad={even_width}:{even_height}:0:0,"
+        video_filter += STILL_IMAGE_FILTER
+
+    if codec != "x264" and not await is_nvenc_available(codec):
+        console.print(
+            "[yellow]! NVENC is not available, falling back to the x264 CPU encoder.[/yellow]"
+        )
+        codec = "x264"
+    if codec == "x264":
+        video_options = X264_VIDEO_OPTIONS
+    else:
+        # * NVENC runs on the GPU's fixed-function encoder and leaves the CPU idle
+        video_options = get_nvenc_video_options(codec=codec, quality=NVENC_QUALITY)
 
+    console.print("[*] Starting video creation with FFmpeg...")
+    total_duration = await get_video_duration(str(audio_path))
+
+    # * Decode and convert the still image once, then repeat that single frame
+    # * with the loop filter; '-loop 1' would re-read and re-decode the file
+    # * for every output frame.
     cmd = [
         "ffmpeg",
         "-y",
-        "-loop",
-        "1",
         "-framerate",
         "1",
         "-i",
         str(image_path),
         "-i",
         str(audio_path),
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-tune",
-        "stillimage",
-        "-crf",
-        "18",
+        "-vf",
+        video_filter,
+        *video_options,
+        *BT709_TAGS,
         "-c:a",
         "aac",
         "-b:a",
         "192k",
-        "-pix_fmt",
-        "yuv420p",
         "-shortest",
-        str(output_path),
     ]
-
-    console.print("[*] Starting video creation with FFmpeg...")
-    total_duration = await get_video_duration(str(audio_path))
+    # * The looped video stream is endless; cap it at the audio length
+    if total_duration:
+        cmd += ["-t", f"{total_duration:.3f}"]
+    cmd.append(str(output_path))
 
     success = await run_ffmpeg_command(
         cmd,
@@ -103,9 +231,61 @@ async def create_video(image_path: Path, audio_path: Path, output_path: Path):
         )
     else:
         console.print(
-            f"[red]! Video creation failed. Check FFmpeg output for details.[/red]"
+            f"[red]! Video creation failed for {output_path.name}. Check FFmpeg output for details.[/red]"
         )
-        raise typer.Exit(code=1)
+    return success
+
+
+def _read_batch_rows(batch_file: Path) -> List[List[str]]:
+    """Read raw 'image, audio[, output]' rows from a CSV or JSON batch file."""
+    if batch_file.suffix.lower() == ".json":
+        with open(batch_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("JSON batch file must contain a list of jobs")
+        rows = []
+        for item in data:
+            if isinstance(item, dict):
+                keys = ("image", "audio", "output")
+                rows.append([str(item.get(key) or "") for key in keys])
+            elif isinstance(item, list):
+                rows.append([str(cell) for cell in item])
+            else:
+                rows.append([str(item)])
+        return rows
+
+    with open(batch_file, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def _load_batch_file(batch_file: Path) -> List[Tuple[Path, Path, Path]]:
+    """
+    Read (image, audio, output) jobs from a CSV or JSON file.
+
+    Each CSV row is 'image,audio[,output]'; a JSON file holds a list of
+    {"image", "audio", "output"} objects or [image, audio, output] lists.
+    Relative paths are resolved against the batch file's folder and a missing
+    output defaults to OUTPUT_DIR/<audio_stem>.mp4, since a batch usually pairs
+    one cover image with many audio tracks. An optional CSV header row
+    starting with 'image' is ignored.
+    """
+    base_dir = batch_file.parent
+    jobs: List[Tuple[Path, Path, Path]] = []
+    for row in _read_batch_rows(batch_file):
+        cells = [cell.strip() for cell in row]
+        if not cells or not cells[0] or cells[0].lower() == "image":
+            continue
+        if len(cells) < 2 or not cells[1]:
+            console.print(f"[yellow]! Skipping malformed row: {row}[/yellow]")
+            continue
+        image_path = base_dir / cells[0]
+        audio_path = base_dir / cells[1]
+        if len(cells) > 2 and cells[2]:
+            output_path = base_dir / cells[2]
+        else:
+            output_path = OUTPUT_DIR / f"{audio_path.stem}.mp4"
+        jobs.append((image_path, audio_path, output_path))
+    return jobs
 
 
 @app.command()
@@ -124,10 +304,19 @@ def run(
             help="Path for the output video file. [default: <image_stem>.mp4]",
         ),
     ] = None,
+    codec: Annotated[
+        str,
+        typer.Option(
+            help="Video encoder: NVENC 'h264' or 'hevc', or 'x264' for CPU-only systems."
+        ),
+    ] = "h264",
 ):
     """
     Creates a video from one image and one audio file.
     """
+    if codec not in SUPPORTED_CODECS:
+        console.print(f"[red]! Unsupported codec: {codec}[/red]")
+        raise typer.Exit(code=1)
     if not image_file.exists():
         console.print(f"[red]! Image file not found: {image_file}[/red]")
         raise typer.Exit(code=1)
@@ -146,10 +335,100 @@ def run(
     console.print(f"[*] Output File: {output_file.name}")
 
     try:
-        asyncio.run(create_video(image_file, audio_file, output_file))
+        success = asyncio.run(create_video(image_file, audio_file, output_file, codec))
     except KeyboardInterrupt:
         console.print("\n[yellow]! User interrupted the process.[/yellow]")
         raise typer.Exit()
+    if not success:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def batch(
+    batch_file: Annotated[
+        Path,
+        typer.Argument(
+            help="CSV file with 'image,audio[,output]' rows, or a JSON list of jobs."
+        ),
+    ],
+    codec: Annotated[
+        str,
+        typer.Option(
+            help="Video encoder: NVENC 'h264' or 'hevc', or 'x264' for CPU-only systems."
+        ),
+    ] = "h264",
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            help="Number of videos to encode at once (bounded by NVENC sessions).",
+            min=1,
+        ),
+    ] = 2,
+) -> None:
+    """
+    Creates several image+audio videos concurrently from a CSV or JSON job list.
+    """
+    if codec not in SUPPORTED_CODECS:
+        console.print(f"[red]! Unsupported codec: {codec}[/red]")
+        raise typer.Exit(code=1)
+    if not batch_file.is_file():
+        console.print(f"[red]! Batch file not found: {batch_file}[/red]")
+        raise typer.Exit(code=1)
+
+    try:
+        batch_jobs = _load_batch_file(batch_file)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]! Could not read batch file: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    jobs = []
+    # * Concurrent jobs writing one file would overwrite each other
+    seen_outputs: Set[str] = set()
+    for image_path, audio_path, output_path in batch_jobs:
+        missing = next((p for p in (image_path, audio_path) if not p.exists()), None)
+        if missing is not None:
+            console.print(f"[red]! Skipping job, file not found: {missing}[/red]")
+            continue
+        output_key = os.path.normcase(os.path.abspath(output_path))
+        if output_key in seen_outputs:
+            console.print(
+                f"[red]! Skipping job, output already used by another job: {output_path}[/red]"
+            )
+            continue
+        seen_outputs.add(output_key)
+        ensure_dir_exists(output_path.parent)
+        jobs.append((image_path, audio_path, output_path))
+
+    if not jobs:
+        console.print("[yellow]! No valid jobs found in the batch file.[/yellow]")
+        raise typer.Exit()
+
+    console.print(f"[*] Found {len(jobs)} video(s) to create.")
+    results: List[bool] = []
+    stop_event = asyncio.Event()
+
+    async def create_and_record(
+        image_path: Path, audio_path: Path, output_path: Path
+    ) -> None:
+        results.append(await create_video(image_path, audio_path, output_path, codec))
+
+    async def main_async() -> None:
+        tasks = [create_and_record(*job) for job in jobs]
+        limit = concurrency
+        if codec != "x264":
+            limit = await clamp_nvenc_concurrency(concurrency, codec)
+        await run_tasks_with_semaphore(tasks, stop_event, limit)
+
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]! User interrupted the process.[/yellow]")
+        stop_event.set()
+
+    succeeded = sum(results)
+    console.print(f"\n[*] Created {succeeded} of {len(jobs)} video(s).")
+    if succeeded < len(jobs):
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
@@ -26,6 +26,8 @@ from littletools_video.ffmpeg_utils import build_loudnorm_filter_complex
 from littletools_video.ffmpeg_utils import get_audio_tracks
 from littletools_video.ffmpeg_utils import get_max_workers
 from littletools_video.ffmpeg_utils import get_metadata_options
+from littletools_video.ffmpeg_utils import measure_loudness
+from littletools_video.ffmpeg_utils import prewarm_probes
 from littletools_video.ffmpeg_utils import run_ffmpeg_command
 from littletools_video.ffmpeg_utils import setup_signal_handlers
 from littletools_video.ffmpeg_utils import standard_main
@@ -62,23 +64,47 @@ async def process_file(
 
     console.print(f"[{position}/{total}] Normalizing {file_path.name}...")
 
+    try:
+        audio_tracks = await get_audio_tracks(str(file_path))
+    except RuntimeError as e:
+        console.print(f"  -> [red]✗ Could not read audio tracks:[/red] {e}")
+        stats.increment("errors")
+        return
+    if not audio_tracks:
+        console.print(f"  -> Skipped (no audio tracks): {file_path.name}")
+        stats.increment("skipped")
+        return
+
+    # * Pass 1: measure every track (audio only, video is never decoded) so
+    # * pass 2 can apply a constant linear gain instead of dynamic loudnorm
+    measurements = await asyncio.gather(
+        *(measure_loudness(str(file_path), i) for i in range(len(audio_tracks)))
+    )
+
     cmd = [
         "ffmpeg",
         "-y",
         "-i",
         str(file_path),
+        "-filter_complex",
+        build_loudnorm_filter_complex(audio_tracks, measurements=measurements),
         "-map",
-        "0",
-        "-c:v",
-        "copy",
-        "-c:s",
+        "0:v?",
+    ]
+    for i in range(len(audio_tracks)):
+        cmd += ["-map", f"[a{i}]"]
+    cmd += [
+        "-map",
+        "0:s?",
+        "-map",
+        "0:t?",
+        "-c",
         "copy",
         "-c:a",
         "aac",
         "-b:a",
         "192k",
-        "-af",
-        "loudnorm=I=-16:TP=-1.5:LRA=11",
+        *get_metadata_options(audio_tracks),
         str(output_path),
     ]
 
@@ -125,6 +151,8 @@ def run(
     stop_event = asyncio.Event()
 
     async def main_async():
+        # * Probe every file up front so workers never wait on ffprobe
+        await prewarm_probes(files)
         tasks = [
             process_file(f, output_dir, overwrite, stats, estimator, i + 1, len(files))
             for i, f in enumerate(files)
@@ -49,7 +49,6 @@ import asyncio
 import json
 import os
 import platform
-import re
 import signal
 import subprocess
 import sys
@@ -63,6 +62,8 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
+from typing import Tuple
 
 # * Third-party imports -----------------------------------------------------------
 from rich.console import Console
@@ -81,10 +82,133 @@ DEFAULT_TARGET_LOUDNESS = -16.0
 DEFAULT_TRUE_PEAK = -1.5
 DEFAULT_LOUDNESS_RANGE = 11.0
 DEFAULT_OUTPUT_FOLDER = "./normalized"
+# * FFmpeg reports progress as newline-delimited key=value records on stdout
+FFMPEG_PROGRESS_OPTIONS = ["-progress", "pipe:1", "-nostats"]
+FFMPEG_STREAM_LIMIT = 1 << 20
+# * Every possible progress bar is built once instead of on each update
+PROGRESS_BAR_LENGTH = 30
+_PROGRESS_BARS = tuple(
+    "█" * filled + "-" * (PROGRESS_BAR_LENGTH - filled)
+    for filled in range(PROGRESS_BAR_LENGTH + 1)
+)
+# * Consumer GPUs cap concurrent NVENC sessions; extra encodes fail or slow
+# * every session down, so batch concurrency is clamped to the probed limit
+NVENC_SESSION_PROBE_MAX = 8
+NVENC_SESSION_CACHE_FILE = (
+    Path.home() / ".cache" / "littletools" / "nvenc_sessions.json"
+)
 
 # * Instantiate a shared Rich console for styled output
 console = Console()
 
+# * ffprobe results keyed by (absolute path, mtime_ns, size); an edited or
+# * replaced file gets a new key, so cached values never go stale
+_PROBE_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+# * In-flight probes, so concurrent callers for one file share one ffprobe
+_PROBE_TASKS: Dict[Tuple[str, int, int], "asyncio.Future[Dict[str, Any]]"] = {}
+# * One ffprobe query covers duration, audio tracks, resolution and frame rate
+FFPROBE_ENTRIES = (
+    "format=duration"
+    ":stream=index,codec_type,codec_name,width,height,avg_frame_rate"
+    ":stream_tags=*"
+    ":stream_disposition=default,forced"
+)
+# * Probed NVENC session limits per encoder for this process, including 0
+_NVENC_SESSION_LIMITS: Dict[str, int] = {}
+# * Single-session probe results per encoder for this process
+_NVENC_AVAILABLE: Dict[str, bool] = {}
+
+_IS_WINDOWS = platform.system() == "Windows"
+# * On POSIX each ffmpeg leads its own process group, so one killpg() stops it
+# * together with any helper processes it spawned
+FFMPEG_SUBPROCESS_KWARGS: Dict[str, Any] = (
+    {} if _IS_WINDOWS else {"start_new_session": True}
+)
+
+
+def _create_kill_on_close_job() -> Optional[int]:
+    """Create a Windows Job Object whose processes die when it is closed."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _BasicLimits(ctypes.Structure):
+            _fields_ = [
+                ("PerProcessUserTimeLimit", ctypes.c_int64),
+                ("PerJobUserTimeLimit", ctypes.c_int64),
+                ("LimitFlags", wintypes.DWORD),
+                ("MinimumWorkingSetSize", ctypes.c_size_t),
+                ("MaximumWorkingSetSize", ctypes.c_size_t),
+                ("ActiveProcessLimit", wintypes.DWORD),
+                ("Affinity", ctypes.c_size_t),
+                ("PriorityClass", wintypes.DWORD),
+                ("SchedulingClass", wintypes.DWORD),
+            ]
+
+        class _ExtendedLimits(ctypes.Structure):
+            _fields_ = [
+                ("BasicLimitInformation", _BasicLimits),
+                ("IoInfo", ctypes.c_uint64 * 6),
+                ("ProcessMemoryLimit", ctypes.c_size_t),
+                ("JobMemoryLimit", ctypes.c_size_t),
+                ("PeakProcessMemoryUsed", ctypes.c_size_t),
+                ("PeakJobMemoryUsed", ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            return None
+        limits = _ExtendedLimits()
+        # * JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        limits.BasicLimitInformation.LimitFlags = 0x2000
+        # * 9 = JobObjectExtendedLimitInformation
+        if not kernel32.SetInformationJobObject(
+            wintypes.HANDLE(job), 9, ctypes.byref(limits), ctypes.sizeof(limits)
+        ):
+            kernel32.CloseHandle(wintypes.HANDLE(job))
+            return None
+        return int(job)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _assign_process_to_job(job: int, pid: int) -> bool:
+    """Put a running Windows process into a Job Object."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        # * PROCESS_SET_QUOTA | PROCESS_TERMINATE
+        handle = kernel32.OpenProcess(0x0100 | 0x0001, False, pid)
+        if not handle:
+            return False
+        try:
+            return bool(
+                kernel32.AssignProcessToJobObject(
+                    wintypes.HANDLE(job), wintypes.HANDLE(handle)
+                )
+            )
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(handle))
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _terminate_job(job: int) -> bool:
+    """Terminate every process in a Windows Job Object with one call."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        return bool(kernel32.TerminateJobObject(wintypes.HANDLE(job), 1))
+    except Exception:  # noqa: BLE001
+        return False
+
 
 class ProcessingStats:
     """Class to track file processing statistics."""
@@ -96,7 +220,10 @@ class ProcessingStats:
         self.start_time = time.monotonic()
         self.interrupted = False
         # * Track active ffmpeg processes (for cancellation)
-        self.active_processes: List[asyncio.subprocess.Process] = []
+        self.active_processes: Set[asyncio.subprocess.Process] = set()
+        # * Windows Job Object holding the processes that were assigned to it
+        self._job: Optional[int] = None
+        self._unassigned: Set[asyncio.subprocess.Process] = set()
 
     def increment(self, key: str) -> None:
         """Increment a stat counter."""
@@ -124,12 +251,41 @@ class ProcessingStats:
 
     def register_process(self, proc: asyncio.subprocess.Process) -> None:
         """Register an active ffmpeg process for tracking."""
-        self.active_processes.append(proc)
+        self.active_processes.add(proc)
+        if _IS_WINDOWS:
+            if self._job is None:
+                self._job = _create_kill_on_close_job()
+            if self._job is None or not _assign_process_to_job(self._job, proc.pid):
+                self._unassigned.add(proc)
 
     def remove_process(self, proc: asyncio.subprocess.Process) -> None:
-        """Remove a process from the active processes list."""
-        if proc in self.active_processes:
-            self.active_processes.remove(proc)
+        """Remove a process from the active processes set."""
+        self.active_processes.discard(proc)
+        self._unassigned.discard(proc)
+
+    def terminate_processes(self) -> None:
+        """Stop all tracked ffmpeg processes along with their children."""
+        if _IS_WINDOWS:
+            # * One TerminateJobObject call replaces a taskkill spawn per PID;
+            # * only processes that could not join the job need taskkill
+            leftovers = list(self._unassigned)
+            if self._job is None or not _terminate_job(self._job):
+                leftovers = list(self.active_processes)
+            for proc in leftovers:
+                if proc.returncode is None:
+                    subprocess.run(
+                        ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+            return
+
+        for proc in list(self.active_processes):
+            if proc.returncode is None:
+                try:
+                    os.killpg(proc.pid, signal.SIGTERM)
+                except (ProcessLookupError, PermissionError):
+                    pass  # Already gone
 
     def print_summary(self, elapsed_time: float) -> None:
         """Print final statistics in a consistent format."""
@@ -250,7 +406,14 @@ def get_mkv_files_from_path(path: str) -> List[str]:
         ValueError: If path is not a directory or MKV file
     """
     if os.path.isdir(path):
-        return [f for f in os.listdir(path) if f.lower().endswith(".mkv")]
+        # * scandir yields entries lazily with their type cached, and only the
+        # * 4-character suffix is lowercased instead of the whole name
+        with os.scandir(path) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name[-4:].lower() == ".mkv" and entry.is_file()
+            ]
     elif os.path.isfile(path) and path.lower().endswith(".mkv"):
         return [path]
     else:
@@ -276,6 +439,88 @@ def check_output_file_exists(output_path: str, overwrite: bool = False) -> bool:
 
 
 # FFmpeg utilities
+def _probe_cache_key(input_path: str) -> Optional[Tuple[str, int, int]]:
+    """Build a cache key that changes whenever the file on disk changes."""
+    try:
+        st = os.stat(input_path)
+    except OSError:
+        return None
+    return os.path.abspath(input_path), st.st_mtime_ns, st.st_size
+
+
+async def _run_ffprobe(input_path: str) -> Dict[str, Any]:
+    """Run ffprobe once and return its parsed JSON output."""
+    ffprobe_cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        FFPROBE_ENTRIES,
+        "-of",
+        "json",
+        str(Path(input_path)),
+    ]
+    proc = await asyncio.create_subprocess_exec(
+        *ffprobe_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"FFprobe error: {stderr.decode(errors='replace')}")
+    try:
+        info = json.loads(stdout.decode())
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"JSON parse error: {e}")
+    return info if isinstance(info, dict) else {}
+
+
+async def probe_media(input_path: str) -> Dict[str, Any]:
+    """
+    Return ffprobe's format and stream info for a file, memoized per file state.
+
+    Concurrent calls for the same file await a single ffprobe process.
+
+    Raises:
+        RuntimeError: If ffprobe fails or its output is not valid JSON
+    """
+    cache_key = _probe_cache_key(str(input_path))
+    if cache_key is None:
+        return await _run_ffprobe(input_path)
+    if cache_key in _PROBE_CACHE:
+        return _PROBE_CACHE[cache_key]
+
+    def _store_result(done: "asyncio.Future[Dict[str, Any]]") -> None:
+        _PROBE_TASKS.pop(cache_key, None)
+        # * Failures are not cached, so a later call can retry
+        if not done.cancelled() and done.exception() is None:
+            _PROBE_CACHE[cache_key] = done.result()
+
+    task = _PROBE_TASKS.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_run_ffprobe(input_path))
+        _PROBE_TASKS[cache_key] = task
+        task.add_done_callback(_store_result)
+    # * Shielded so one cancelled caller does not abort the probe for the others
+    return await asyncio.shield(task)
+
+
+async def prewarm_probes(
+    paths: Sequence[Any], concurrency: Optional[int] = None
+) -> None:
+    """
+    Probe many files at once so later probe helpers are served from the cache.
+
+    ffprobe is cheap but slow to spawn, so the spawns are overlapped; failures
+    are ignored here and reported by the helper that needs the value.
+    """
+    semaphore = asyncio.Semaphore(concurrency or get_max_workers() * 2)
+
+    async def _probe_one(path: Any) -> None:
+        async with semaphore:
+            await probe_media(str(path))
+
+    await asyncio.gather(*(_probe_one(p) for p in paths), return_exceptions=True)
+
+
 async def get_audio_tracks(
     input_path: str, verbose: bool = False
 ) -> List[Dict[str, Any]]:
@@ -292,49 +537,81 @@ async def get_audio_tracks(
     Raises:
         RuntimeError: If ffprobe fails or JSON parsing fails
     """
-    input_path_quoted = str(Path(input_path))  # Proper path handling
+    media_info = await probe_media(input_path)
+    streams = media_info.get("streams", [])
+    if not isinstance(streams, list):
+        streams = []
+    tracks = [s for s in streams if s.get("codec_type") == "audio"]
 
-    # Use more comprehensive metadata extraction flags
-    ffprobe_cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "a",
-        "-show_entries",
-        "stream=index,codec_type,codec_name:stream_tags=*:format_tags=*",
-        "-of",
-        "json",
-        input_path_quoted,
-    ]
-
-    # Debug: print ffprobe command
+    # Debug: print found tracks
     if verbose:
-        print(f"! Запрос метаданных аудио: {' '.join(ffprobe_cmd)}")
+        for i, track in enumerate(tracks):
+            print(f"! Найдена аудиодорожка {i+1}: {track}")
 
-    ffprobe_proc = await asyncio.create_subprocess_exec(
-        *ffprobe_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-    )
-    stdout, stderr = await ffprobe_proc.communicate()
+    return tracks
+
+
+async def measure_loudness(
+    input_path: str,
+    track_index: int = 0,
+    target_loudness: float = DEFAULT_TARGET_LOUDNESS,
+    true_peak: float = DEFAULT_TRUE_PEAK,
+    loudness_range: float = DEFAULT_LOUDNESS_RANGE,
+) -> Optional[Dict[str, str]]:
+    """
+    Run the loudnorm analysis pass over a single audio track.
 
-    if ffprobe_proc.returncode != 0:
-        raise RuntimeError(f"FFprobe error: {stderr.decode()}")
+    Only the selected audio stream is mapped, so video is never decoded.
 
+    Args:
+        input_path: Path to the input media file
+        track_index: Index of the audio track (0-based, among audio streams)
+        target_loudness: Target integrated loudness in LUFS
+        true_peak: Maximum true peak in dBTP
+        loudness_range: Target loudness range in LU
+
+    Returns:
+        dict: loudnorm JSON measurements, or None if the analysis failed
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        str(input_path),
+        "-map",
+        f"0:a:{track_index}",
+        "-af",
+        f"loudnorm=I={target_loudness}:TP={true_peak}:LRA={loudness_range}"
+        ":print_format=json",
+        "-f",
+        "null",
+        "-",
+    ]
     try:
-        audio_info: Dict[str, Any] = json.loads(stdout.decode())
-        # * Explicitly cast to satisfy static type checkers
-        tracks = audio_info.get("streams", [])
-        if not isinstance(tracks, list):
-            tracks = []
-
-        # Debug: print found tracks
-        if verbose:
-            for i, track in enumerate(tracks):
-                print(f"! Найдена аудиодорожка {i+1}: {track}")
-
-        return tracks
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"JSON parse error: {e}")
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    # * loudnorm prints its JSON block last on stderr
+    text = stderr.decode("utf-8", errors="replace")
+    start, end = text.rfind("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        measurements: Dict[str, str] = json.loads(text[start : end + 1])
+    except json.JSONDecodeError:
+        return None
+
+    # ! Silent tracks measure as -inf and cannot be corrected linearly
+    if "inf" in measurements.get("input_i", "inf"):
+        return None
+    return measurements
 
 
 def build_loudnorm_filter_complex(
@@ -342,6 +619,7 @@ def build_loudnorm_filter_complex(
     target_loudness: float = DEFAULT_TARGET_LOUDNESS,
     true_peak: float = DEFAULT_TRUE_PEAK,
     loudness_range: float = DEFAULT_LOUDNESS_RANGE,
+    measurements: Optional[Sequence[Optional[Dict[str, str]]]] = None,
 ) -> str:
     """
     Build ffmpeg filter_complex string for audio normalization.
@@ -351,22 +629,34 @@ def build_loudnorm_filter_complex(
         target_loudness: Target integrated loudness in LUFS
         true_peak: Maximum true peak in dBTP
         loudness_range: Target loudness range in LU
+        measurements: Optional per-track results of measure_loudness(); tracks
+            with a measurement get the linear second pass, others single-pass
 
     Returns:
         str: filter_complex string for ffmpeg
     """
-    filter_complex = "".join(
-        f"[0:a:{i}]loudnorm=I={target_loudness}:TP={true_peak}:LRA={loudness_range}[a{i}];"
-        for i in range(len(audio_tracks))
-    )
-    return filter_complex.rstrip(";")
+    filters = []
+    for i in range(len(audio_tracks)):
+        params = f"I={target_loudness}:TP={true_peak}:LRA={loudness_range}"
+        measured = measurements[i] if measurements else None
+        if measured:
+            params += (
+                f":measured_I={measured['input_i']}"
+                f":measured_TP={measured['input_tp']}"
+                f":measured_LRA={measured['input_lra']}"
+                f":measured_thresh={measured['input_thresh']}"
+                f":offset={measured['target_offset']}:linear=true"
+            )
+        filters.append(f"[0:a:{i}]loudnorm={params}[a{i}]")
+    return ";".join(filters)
 
 
 def get_metadata_options(
     audio_tracks: List[Dict[str, Any]], verbose: bool = False
 ) -> List[str]:
     """
-    Generate ffmpeg metadata options to preserve audio track titles.
+    Generate ffmpeg metadata options to preserve audio track titles, languages
+    and dispositions.
 
     Args:
         audio_tracks: List of audio tracks with metadata
@@ -396,6 +686,16 @@ def get_metadata_options(
             if verbose:
                 print(f"! Сохранение названия аудиодорожки {i+1}: '{title}'")
 
+        # * Filtered streams lose their tags, so carry the language over too
+        language = track.get("tags", {}).get("language")
+        if language:
+            metadata_options.extend([f"-metadata:s:a:{i}", f"language={language}"])
+
+        # * Keep the default/forced flags so players still pick the same track
+        disposition = track.get("disposition", {})
+        flags = [flag for flag in ("default", "forced") if disposition.get(flag)]
+        metadata_options.extend([f"-disposition:a:{i}", "+".join(flags) or "0"])
+
     # If no titles were found, print a debug message
     if not metadata_options and verbose:
         print("! Не найдены названия аудиодорожек для сохранения")
@@ -466,6 +766,131 @@ def get_nvenc_video_options(codec: str, quality: str) -> list[str]:
     ] + base_options
 
 
+async def _try_nvenc_session(encoder: str) -> bool:
+    """Run a short real-time NVENC encode; True if the session could be opened."""
+    cmd = [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-re",
+        "-f",
+        "lavfi",
+        "-i",
+        "nullsrc=s=256x256:r=25",
+        "-frames:v",
+        "10",
+        "-c:v",
+        encoder,
+        "-f",
+        "null",
+        "-",
+    ]
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await proc.wait() == 0
+    except OSError:
+        return False
+
+
+async def _query_gpu(fields: str) -> Optional[List[str]]:
+    """Query the first GPU via nvidia-smi; None if it is missing or fails."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "nvidia-smi",
+            f"--query-gpu={fields}",
+            "--format=csv,noheader",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+    except OSError:
+        return None
+    lines = stdout.decode(errors="replace").strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        return None
+    return [value.strip() for value in lines[0].split(",")]
+
+
+async def get_nvenc_session_limit(codec: str = "hevc") -> int:
+    """
+    Returns how many NVENC sessions the GPU accepts at once (0 if none).
+
+    All probe encodes run simultaneously (each lasts ~0.4s thanks to '-re'),
+    so every successful one held a session while the others were open. The
+    result is cached on disk per driver version and GPU, as the cap only
+    changes with them. Probes taken while other encodes were running are
+    only kept for this process, since those sessions skew the count.
+    """
+    encoder = "h264_nvenc" if codec == "h264" else "hevc_nvenc"
+    if encoder in _NVENC_SESSION_LIMITS:
+        return _NVENC_SESSION_LIMITS[encoder]
+    gpu = await _query_gpu("driver_version,name")
+    gpu_key = " | ".join(gpu) if gpu else "no-gpu"
+    cached: Dict[str, Dict[str, int]] = {}
+    try:
+        cached = json.loads(NVENC_SESSION_CACHE_FILE.read_text(encoding="utf-8"))
+        entry = cached.get(gpu_key)
+        if isinstance(entry, dict) and isinstance(entry.get(encoder), int):
+            _NVENC_SESSION_LIMITS[encoder] = entry[encoder]
+            return entry[encoder]
+    except (OSError, ValueError, AttributeError):
+        cached = {}
+
+    # * Without nvidia-smi there is no GPU to be busy, so that probe is idle too
+    sessions = await _query_gpu("encoder.stats.sessionCount") if gpu else ["0"]
+    idle = sessions == ["0"]
+    results = await asyncio.gather(
+        *(_try_nvenc_session(encoder) for _ in range(NVENC_SESSION_PROBE_MAX))
+    )
+    limit = sum(results)
+    _NVENC_SESSION_LIMITS[encoder] = limit
+    if idle:
+        entry = cached.get(gpu_key)
+        cached[gpu_key] = {**(entry if isinstance(entry, dict) else {}), encoder: limit}
+        try:
+            ensure_dir_exists(NVENC_SESSION_CACHE_FILE.parent)
+            NVENC_SESSION_CACHE_FILE.write_text(json.dumps(cached), encoding="utf-8")
+        except OSError:
+            pass
+    return limit
+
+
+async def is_nvenc_available(codec: str = "hevc") -> bool:
+    """
+    Returns True if one NVENC session can be opened.
+
+    A single encode needs one session, so this reuses a limit already probed
+    in this process and otherwise runs one probe encode instead of the full
+    concurrent probe of get_nvenc_session_limit().
+    """
+    encoder = "h264_nvenc" if codec == "h264" else "hevc_nvenc"
+    if encoder in _NVENC_SESSION_LIMITS:
+        return _NVENC_SESSION_LIMITS[encoder] > 0
+    if encoder not in _NVENC_AVAILABLE:
+        _NVENC_AVAILABLE[encoder] = await _try_nvenc_session(encoder)
+    return _NVENC_AVAILABLE[encoder]
+
+
+async def clamp_nvenc_concurrency(concurrency: int, codec: str = "hevc") -> int:
+    """Limit concurrency to the NVENC session cap, warning when it is lowered."""
+    if concurrency <= 1:
+        return concurrency
+    limit = await get_nvenc_session_limit(codec)
+    # * A full probe only proves a lower bound, so it never clamps
+    if 0 < limit < min(concurrency, NVENC_SESSION_PROBE_MAX):
+        console.print(
+            f"[yellow]! GPU allows {limit} concurrent NVENC session(s); "
+            f"reducing concurrency from {concurrency} to {limit}.[/yellow]"
+        )
+        return limit
+    return concurrency
+
+
 async def run_ffmpeg_command(  # noqa: C901
     cmd: List[str],
     stats: Optional[ProcessingStats] = None,
@@ -495,84 +920,61 @@ async def run_ffmpeg_command(  # noqa: C901
         bool: True if command succeeded, False otherwise
     """
     cmd = [arg for arg in cmd if arg]
+    if Path(cmd[0]).stem.lower() == "ffmpeg" and "-progress" not in cmd:
+        cmd[1:1] = FFMPEG_PROGRESS_OPTIONS
     proc = None
     try:
+        # * The log on stderr was only scraped for progress and never shown;
+        # * -progress replaces it, so it is discarded instead of parsed
         proc = await asyncio.create_subprocess_exec(
-            *cmd, stderr=asyncio.subprocess.PIPE
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=FFMPEG_STREAM_LIMIT,
+            **FFMPEG_SUBPROCESS_KWARGS,
         )
-        # * Guarantee for type checkers that proc.stderr is not None
-        assert proc.stderr is not None
+        # * Guarantee for type checkers that proc.stdout is not None
+        assert proc.stdout is not None
         if stats:
             stats.register_process(proc)
 
-        stderr_output: List[str] = []
-        buffer = ""
-        time_pattern = re.compile(r"time=(\d{2}):(\d{2}):(\d{2})\.(\d{2})")
-        speed_pattern = re.compile(r"speed=\s*(\d+\.?\d*)x")
+        current_seconds = 0.0
+        speed = 1.0
 
         file_prefix = ""
         if file_position and file_count and filename:
             file_prefix = f"[{file_position}/{file_count}] {filename} "
 
-        while True:
-            # Break loop if process has exited
-            if proc.returncode is not None:
-                break
+        # * The stream reaches EOF when ffmpeg exits, so no polling timeout is needed
+        async for line in proc.stdout:
+            key, _, value = (
+                line.decode("ascii", errors="replace").strip().partition("=")
+            )
+            # * out_time_ms is also in microseconds despite its name
+            if key in ("out_time_us", "out_time_ms"):
+                if value.isdigit():
+                    current_seconds = int(value) / 1_000_000
+            elif key == "speed":
+                try:
+                    speed = float(value.rstrip("x")) or 1.0
+                except ValueError:
+                    speed = 1.0  # 'N/A' before the first frame
+            # * Each record block ends with progress=continue|end; draw once per block
+            elif key == "progress" and total_duration and total_duration > 0:
+                progress_percent = (current_seconds / total_duration) * 100
+                eta_seconds = (
+                    (total_duration - current_seconds) / speed if speed > 0 else 0
+                )
 
-            try:
-                # Read chunk with a timeout to avoid blocking forever
-                chunk = await asyncio.wait_for(proc.stderr.read(1024), timeout=2.0)
-                if not chunk:
-                    break  # End of stream
-            except asyncio.TimeoutError:
-                continue  # Check proc.returncode again
-
-            buffer += chunk.decode("utf-8", errors="replace")
-            # FFmpeg uses \r to update progress line
-            lines = buffer.split("\r")
-            buffer = lines.pop()  # Keep potentially incomplete line part in buffer
-
-            for line_text in lines:
-                if not line_text:
-                    continue
-
-                line_to_log = line_text.strip()
-                if line_to_log:
-                    stderr_output.append(line_to_log)
-
-                if "time=" in line_text:
-                    time_match = time_pattern.search(line_text)
-                    speed_match = speed_pattern.search(line_text)
-
-                    if time_match and total_duration and total_duration > 0:
-                        hours, minutes, seconds, hundredths = map(
-                            int, time_match.groups()
-                        )
-                        current_seconds = (
-                            hours * 3600 + minutes * 60 + seconds + hundredths / 100
-                        )
-                        speed = (
-                            float(speed_match.group(1))
-                            if speed_match and float(speed_match.group(1)) > 0
-                            else 1.0
-                        )
-                        progress_percent = (current_seconds / total_duration) * 100
-                        eta_seconds = (
-                            (total_duration - current_seconds) / speed
-                            if speed > 0
-                            else 0
-                        )
-
-                        bar_length = 30
-                        filled_len = int(bar_length * progress_percent / 100)
-                        bar = "█" * filled_len + "-" * (bar_length - filled_len)
-
-                        progress_line = (
-                            f"\r{file_prefix}{bar} {progress_percent:.1f}% | "
-                            f"Speed: {speed:.1f}x | ETA: {format_duration(eta_seconds)}  "
-                        )
-                        sys.stdout.write(progress_line)
-                        sys.stdout.flush()
+                filled_len = int(PROGRESS_BAR_LENGTH * progress_percent / 100)
+                bar = _PROGRESS_BARS[max(0, min(filled_len, PROGRESS_BAR_LENGTH))]
+
+                progress_line = (
+                    f"\r{file_prefix}{bar} {progress_percent:.1f}% | "
+                    f"Speed: {speed:.1f}x | ETA: {format_duration(eta_seconds)}  "
+                )
+                sys.stdout.write(progress_line)
+                sys.stdout.flush()
 
         await proc.wait()
 
@@ -610,76 +1012,68 @@ async def run_ffmpeg_command(  # noqa: C901
 
 
 async def get_video_duration(input_path: str) -> Optional[float]:
-    """Get video duration in seconds using ffprobe."""
-    ffprobe_cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        str(input_path),
-    ]
-    proc = None
+    """Get video duration in seconds using ffprobe (memoized per file state)."""
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *ffprobe_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-        if proc.returncode == 0 and stdout:
-            return float(stdout.decode().strip())
-        else:
-            print(
-                f"! ffprobe error getting duration for {Path(input_path).name}: {stderr.decode()}"
-            )
+        media_info = await probe_media(input_path)
+        duration = media_info.get("format", {}).get("duration")
+        if duration is None:
+            print(f"! ffprobe reported no duration for {Path(input_path).name}")
             return None
+        return float(duration)
+    except RuntimeError as e:
+        print(f"! ffprobe error getting duration for {Path(input_path).name}: {e}")
+        return None
     except Exception as e:
         print(f"! Exception getting duration for {Path(input_path).name}: {e}")
         return None
 
 
+async def _get_first_video_stream(input_path: str) -> Optional[Dict[str, Any]]:
+    """Return the probed info of the first video stream, if there is one."""
+    media_info = await probe_media(input_path)
+    for stream in media_info.get("streams", []):
+        if isinstance(stream, dict) and stream.get("codec_type") == "video":
+            return stream
+    return None
+
+
 async def get_video_resolution(input_path: str) -> Optional[tuple[int, int]]:
     """Get video resolution (width, height) using ffprobe."""
-    ffprobe_cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=width,height",
-        "-of",
-        "csv=s=x:p=0",
-        str(input_path),
-    ]
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *ffprobe_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-        if proc.returncode == 0 and stdout:
-            res_str = stdout.decode().strip()
-            if "x" in res_str:
-                width, height = map(int, res_str.split("x"))
-                return width, height
-            else:
-                print(
-                    f"! ffprobe returned empty resolution for {Path(input_path).name}"
-                )
-                return None
-        else:
-            # ! Don't print error if there's no video stream, it's a valid case for audio-only files.
-            if "Stream specifier v:0 matches no streams" not in stderr.decode():
-                print(
-                    f"! ffprobe error getting resolution for {Path(input_path).name}: {stderr.decode()}"
-                )
+        stream = await _get_first_video_stream(input_path)
+        # ! No video stream is a valid case for audio-only files, so stay quiet
+        if stream is None:
             return None
+        width, height = stream.get("width"), stream.get("height")
+        if not width or not height:
+            print(f"! ffprobe returned empty resolution for {Path(input_path).name}")
+            return None
+        return int(width), int(height)
+    except RuntimeError as e:
+        print(f"! ffprobe error getting resolution for {Path(input_path).name}: {e}")
+        return None
     except Exception as e:
         print(f"! Exception getting resolution for {Path(input_path).name}: {e}")
         return None
 
 
+async def get_video_frame_rate(input_path: str) -> Optional[float]:
+    """Get the average frame rate of the first video stream using ffprobe."""
+    try:
+        stream = await _get_first_video_stream(input_path)
+        if stream is None:
+            return None
+        # * ffprobe reports a fraction such as "30000/1001" ("0/0" when unknown)
+        num, _, den = str(stream.get("avg_frame_rate", "")).partition("/")
+        rate = float(num) / float(den or 1)
+        return rate if rate > 0 else None
+    except (RuntimeError, ValueError, ZeroDivisionError):
+        return None
+    except Exception as e:
+        print(f"! Exception getting frame rate for {Path(input_path).name}: {e}")
+        return None
+
+
 async def convert_to_compatible_mp4(
     input_path: str, output_dir: str = "temp_videos"
 ) -> Optional[str]:
@@ -776,22 +1170,11 @@ def setup_signal_handlers(  # noqa: C901
         stop_event.set()
 
         # * First terminate any running ffmpeg processes
-        if stats and hasattr(stats, "active_processes"):
-            for proc in stats.active_processes[:]:  # Use a copy of the list
-                if proc and proc.returncode is None:  # Process is still running
-                    try:
-                        # On Windows use taskkill to force terminate
-                        if platform.system() == "Windows":
-                            subprocess.run(
-                                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                            )
-                        else:
-                            # On Unix/Linux use terminate signal
-                            proc.terminate()
-                    except Exception:
-                        pass  # Ignore errors during termination
+        if stats:
+            try:
+                stats.terminate_processes()
+            except Exception:
+                pass  # Ignore errors during termination
 
         # Give processes a moment to terminate
         time.sleep(0.5)
@@ -802,7 +1185,7 @@ def setup_signal_handlers(  # noqa: C901
                 task.cancel()
 
     # ! Different signal handling for Windows vs Unix
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         signal.signal(
             signal.SIGINT, lambda *_: loop.call_soon_threadsafe(signal_handler)
         )
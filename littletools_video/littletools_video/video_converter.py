@@ -42,11 +42,16 @@ from littletools_core.utils import format_duration
 from littletools_core.utils import prompt_for_interactive_settings
 from littletools_core.utils import run_tasks_with_semaphore
 from littletools_core.utils import safe_delete
+from littletools_core.utils import safe_delete_many
 from littletools_core.utils import setup_signal_handler
 from littletools_video.ffmpeg_utils import ProcessingStats
+from littletools_video.ffmpeg_utils import clamp_nvenc_concurrency
+from littletools_video.ffmpeg_utils import get_nvenc_session_limit
 from littletools_video.ffmpeg_utils import get_nvenc_video_options
 from littletools_video.ffmpeg_utils import get_video_duration
+from littletools_video.ffmpeg_utils import get_video_frame_rate
 from littletools_video.ffmpeg_utils import get_video_resolution
+from littletools_video.ffmpeg_utils import prewarm_probes
 from littletools_video.ffmpeg_utils import run_ffmpeg_command
 
 # * Create a Typer application for this specific tool
@@ -61,6 +66,18 @@ console = Console()
 # * The user can override these with CLI options.
 INPUT_DIR = Path.cwd() / "0-INPUT-0"
 OUTPUT_DIR = Path.cwd() / "0-OUTPUT-0"
+# * Decode on NVDEC so the CPU only runs the filters. Frames are downloaded to
+# * system memory, so the CPU filter chain is unchanged, and ffmpeg falls back
+# * to software decoding for codecs the GPU cannot decode.
+NVDEC_INPUT_OPTIONS = ["-hwaccel", "cuda"]
+
+
+async def _get_decode_options(codec: str) -> List[str]:
+    """Return the NVDEC input options if the GPU accepts NVENC/CUDA sessions."""
+    # ! Without a CUDA device '-hwaccel cuda' aborts instead of falling back
+    if await get_nvenc_session_limit(codec) > 0:
+        return NVDEC_INPUT_OPTIONS
+    return []
 
 
 async def _process_single_file_for_conversion(
@@ -113,7 +130,13 @@ async def _process_single_file_for_conversion(
         )
 
     if fps != "original":
-        filters.append(f"fps={fps}")
+        # * When dropping frames, run fps before scale so only kept frames are
+        # * scaled; when raising the rate, scale first so duplicates are not
+        source_fps = await get_video_frame_rate(str(file_path)) if filters else None
+        if source_fps and source_fps > float(fps):
+            filters.insert(0, f"fps={fps}")
+        else:
+            filters.append(f"fps={fps}")
 
     # * For H.264, force 8-bit pixel format to avoid errors with 10-bit sources on consumer GPUs.
     if codec == "h264":
@@ -130,7 +153,7 @@ async def _process_single_file_for_conversion(
     )
 
     cmd = (
-        ["ffmpeg", "-y", "-i", str(file_path)]
+        ["ffmpeg", "-y", *await _get_decode_options(codec), "-i", str(file_path)]
         + video_cmd
         + audio_cmd
         + [str(output_path)]
@@ -234,6 +257,7 @@ def convert(
     async def main_async_logic() -> float:
         logic_start_time = time.time()
         console.print("[*] Calculating total video duration for ETA...")
+        await prewarm_probes(files_to_process)
         for file_path in files_to_process:
             duration = await get_video_duration(str(file_path))
             if duration:
@@ -265,7 +289,9 @@ def convert(
             for i, file in enumerate(files_to_process)
         ]
 
-        await run_tasks_with_semaphore(tasks, stop_event, concurrency)
+        await run_tasks_with_semaphore(
+            tasks, stop_event, await clamp_nvenc_concurrency(concurrency, codec)
+        )
         return time.time() - logic_start_time
 
     total_elapsed_time = 0.0
@@ -428,6 +454,7 @@ def single() -> None:  # noqa: C901
         async def run_conversion() -> None:
             # * Calculate total video duration for ETA
             console.print("[*] Calculating total video duration for ETA...")
+            await prewarm_probes(files_to_process)
             for fp in files_to_process:
                 duration = await get_video_duration(str(fp))
                 if duration:
@@ -664,6 +691,7 @@ def tree() -> None:  # noqa: C901
             # --- Estimate time ---
             if video_files_to_process:
                 console.print("\n[*] Calculating total video duration for ETA...")
+                await prewarm_probes(video_files_to_process)
                 for file_path in video_files_to_process:
                     # ! Check for interruption during duration calculation
                     if stop_event.is_set():
@@ -834,7 +862,13 @@ async def _convert_single_file_for_merge(
                 filters.append(f"scale=-2:{target_height}:flags=lanczos")
 
     if fps != "original":
-        filters.append(f"fps={fps}")
+        # * When dropping frames, run fps before scale so only kept frames are
+        # * scaled; when raising the rate, scale first so duplicates are not
+        source_fps = await get_video_frame_rate(str(file_path)) if filters else None
+        if source_fps and source_fps > float(fps):
+            filters.insert(0, f"fps={fps}")
+        else:
+            filters.append(f"fps={fps}")
 
     # * For H.264, force 8-bit pixel format to avoid errors with 10-bit sources on consumer GPUs.
     if codec == "h264":
@@ -851,7 +885,7 @@ async def _convert_single_file_for_merge(
     )
 
     cmd = (
-        ["ffmpeg", "-y", "-i", str(file_path)]
+        ["ffmpeg", "-y", *await _get_decode_options(codec), "-i", str(file_path)]
         + video_cmd
         + audio_cmd
         + [str(converted_path)]
@@ -941,6 +975,7 @@ def merge(  # noqa: C901
 
         async def merge_async_logic() -> bool:
             console.print("[*] Calculating total duration for ETA...")
+            await prewarm_probes(inputs)
             for file_path in inputs:
                 duration = await get_video_duration(str(file_path))
                 if duration:
@@ -1025,9 +1060,8 @@ def merge(  # noqa: C901
         console.print(f"\n[green]✓ Merge successful![/green] Output: {output}")
         if cleanup:
             console.print("[*] Deleting source files as requested...")
-            for file_path in inputs:
-                if safe_delete(file_path):
-                    console.print(f"  - Deleted: {file_path.name}")
+            deleted_count = safe_delete_many(inputs)
+            console.print(f"  - Deleted {deleted_count} of {len(inputs)} file(s)")
     else:
         console.print("\n[red]✗ Merge process failed or was interrupted.[/red]")
 
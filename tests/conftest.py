@@ -0,0 +1,17 @@
+"""Make the monorepo packages importable without an editable install."""
+
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+# * Same package roots as the pyright extraPaths in pyproject.toml
+for _package in (
+    "littletools_cli",
+    "littletools_core",
+    "littletools_speech",
+    "littletools_txt",
+    "littletools_video",
+):
+    _path = str(_ROOT / _package)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,20 @@
+from littletools_core import utils
+from littletools_core.utils import BatchTimeEstimator
+
+
+def test_eta_survives_back_to_back_updates(monkeypatch):
+    clock = iter([0, 10 * 10**9, 10 * 10**9 + 1])
+    monkeypatch.setattr(utils.time, "monotonic_ns", lambda: next(clock))
+
+    estimator = BatchTimeEstimator()
+    estimator.add_item(10)
+    estimator.add_item(10)
+    estimator.add_item(20)
+    estimator.start()
+    # * Two concurrent items finish 1 ns apart after 10 seconds
+    estimator.update(10)
+    estimator.update(10)
+
+    # * 20 units took 10 s, so the remaining 20 units need about 10 s more;
+    # * a per-interval rate over the 1 ns gap would collapse the ETA to 00:00
+    assert "00:05" <= estimator.get_eta_str() <= "00:20"
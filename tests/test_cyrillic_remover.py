@@ -0,0 +1,30 @@
+import re
+
+from littletools_txt.CyrillicRemover import _RE_TO_LAST
+from littletools_txt.CyrillicRemover import remove_all_cyrillic
+from littletools_txt.CyrillicRemover import remove_from_first_cyrillic
+from littletools_txt.CyrillicRemover import remove_to_last_cyrillic
+
+
+def test_line_modes_keep_line_breaks():
+    content = "abc Привет def\nno cyrillic\nЖ tail\n"
+    assert remove_from_first_cyrillic(content) == "abc \nno cyrillic\n\n"
+    assert remove_to_last_cyrillic(content) == " def\nno cyrillic\n tail\n"
+
+
+def test_remove_all_cyrillic():
+    assert remove_all_cyrillic("a Ёж b ѣ") == "a  b "
+
+
+def test_to_last_pattern_is_anchored_per_line():
+    # * Unanchored, '.*' is retried from every column of a line without
+    # * Cyrillic, which is quadratic in the line length
+    assert _RE_TO_LAST.pattern.startswith("^")
+    assert _RE_TO_LAST.flags & re.MULTILINE
+
+
+def test_line_modes_on_long_lines_without_cyrillic():
+    lines = "\n".join(["x" * 2000] * 2000)
+    content = lines + "\nend Ж"
+    assert remove_to_last_cyrillic(content) == lines + "\n"
+    assert remove_from_first_cyrillic(content) == lines + "\nend "